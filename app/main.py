@@ -6,24 +6,27 @@ Fork of WhisperTux with AMD GPU support
 """
 
 import sys
+import logging
 import threading
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QFrame, QComboBox, QDialog,
+    QLabel, QPushButton, QTextEdit, QPlainTextEdit, QFrame, QComboBox, QDialog,
     QScrollArea, QLineEdit, QCheckBox, QSpinBox, QMessageBox,
     QFileDialog, QListWidget, QListWidgetItem, QButtonGroup,
     QRadioButton, QGroupBox, QSizePolicy, QSystemTrayIcon, QMenu,
     QProgressBar, QTableWidget, QTableWidgetItem, QHeaderView,
     QAbstractItemView, QStackedWidget
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QSize
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QSize, QThread
 from PySide6.QtGui import (
-    QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QAction
+    QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QAction, QKeySequence,
+    QShortcut
 )
 
 # Import custom modules
@@ -34,9 +37,11 @@ from src.config_manager import ConfigManager
 from src.global_shortcuts import GlobalShortcuts, get_available_keyboards
 from src.benchmark import (
     WhisperBenchmark, BENCHMARK_SAMPLES, BenchmarkResult, ModelSummary,
-    calculate_wer, calculate_efficiency_score
+    score_transcription, summarize_results
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Color scheme
 COLORS = {
@@ -53,6 +58,13 @@ COLORS = {
     'border': '#45475a',
 }
 
+# Maximum number of transcription lines kept in the main window history
+MAX_TRANSCRIPTION_BLOCKS = 500
+
+# Longest single transcription shown in the history; longer text is cropped
+# for display only (the full text is still injected/copied to the clipboard)
+MAX_TRANSCRIPTION_DISPLAY_CHARS = 100_000
+
 
 def get_stylesheet():
     """Return the application stylesheet"""
@@ -176,7 +188,7 @@ def get_stylesheet():
             font-weight: bold;
         }}
 
-        QTextEdit {{
+        QTextEdit, QPlainTextEdit {{
             background-color: {COLORS['surface']};
             color: {COLORS['text']};
             border: 1px solid {COLORS['border']};
@@ -375,6 +387,16 @@ def get_stylesheet():
     """
 
 
+def set_stylesheet_if_changed(widget: QWidget, stylesheet: str):
+    """Apply a stylesheet only if it differs from the widget's current one
+
+    Qt re-resolves styles on every setStyleSheet() call, even for an
+    identical string, so no-op updates are skipped here.
+    """
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
 class AudioFeedback:
     """Provides audio feedback beeps for recording state changes"""
 
@@ -436,6 +458,21 @@ class AudioFeedback:
 class AudioLevelWidget(QWidget):
     """Enhanced audio level meter widget with smooth animation"""
 
+    # Paint colors, resolved from COLORS once rather than on every frame
+    _BG_COLOR = QColor(COLORS['surface'])
+    _BORDER_COLOR = QColor(COLORS['border'])
+    _RECORDING_COLOR = QColor(COLORS['error'])
+    _LOW_COLOR = QColor(COLORS['success'])
+    _MID_COLOR = QColor(COLORS['warning'])
+    _HIGH_COLOR = QColor(COLORS['error'])
+    _PEAK_COLOR = QColor(COLORS['text'])
+
+    # Animation cadence: full rate while there is signal, slow tick when quiet
+    _ACTIVE_INTERVAL_MS = 16  # ~60fps
+    _QUIET_INTERVAL_MS = 200  # ~5fps
+    _ACTIVITY_THRESHOLD = 0.05
+    _ACTIVITY_HOLD_S = 0.5
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.level = 0.0
@@ -443,13 +480,14 @@ class AudioLevelWidget(QWidget):
         self.peak_level = 0.0
         self.peak_hold_frames = 0
         self.is_recording = False
+        self._activity_until = 0.0
         self.setMinimumHeight(36)
         self.setMaximumHeight(36)
 
         # Animation timer for smooth level changes
         self._animation_timer = QTimer(self)
         self._animation_timer.timeout.connect(self._animate_level)
-        self._animation_timer.setInterval(16)  # ~60fps
+        self._animation_timer.setInterval(self._ACTIVE_INTERVAL_MS)
 
     def set_level(self, level: float):
         """Set the audio level (0.0 to 1.0)"""
@@ -458,6 +496,10 @@ class AudioLevelWidget(QWidget):
         if self.level > self.peak_level:
             self.peak_level = self.level
             self.peak_hold_frames = 30  # Hold peak for ~0.5s
+        if self.level > self._ACTIVITY_THRESHOLD:
+            self._activity_until = time.monotonic() + self._ACTIVITY_HOLD_S
+            if self._animation_timer.interval() != self._ACTIVE_INTERVAL_MS:
+                self._animation_timer.setInterval(self._ACTIVE_INTERVAL_MS)
         if not self._animation_timer.isActive() and self.is_recording:
             self._animation_timer.start()
 
@@ -479,12 +521,23 @@ class AudioLevelWidget(QWidget):
 
         if not self.is_recording and self.display_level < 0.01:
             self._animation_timer.stop()
+            return
+
+        # Drop to the slow tick once the input has been quiet for a moment
+        # and nothing visible is still animating
+        quiet = (time.monotonic() >= self._activity_until
+                 and self.display_level < self._ACTIVITY_THRESHOLD
+                 and self.peak_level < self._ACTIVITY_THRESHOLD)
+        interval = self._QUIET_INTERVAL_MS if quiet else self._ACTIVE_INTERVAL_MS
+        if self._animation_timer.interval() != interval:
+            self._animation_timer.setInterval(interval)
 
     def set_recording(self, recording: bool):
         """Set recording state"""
         self.is_recording = recording
         if recording:
-            self._animation_timer.start()
+            self._activity_until = time.monotonic() + self._ACTIVITY_HOLD_S
+            self._animation_timer.start(self._ACTIVE_INTERVAL_MS)
         else:
             self.level = 0.0
             self.peak_level = 0.0
@@ -496,14 +549,13 @@ class AudioLevelWidget(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Background with subtle gradient feel
-        bg_color = QColor(COLORS['surface'])
-        painter.fillRect(self.rect(), bg_color)
+        painter.fillRect(self.rect(), self._BG_COLOR)
 
         # Border - highlighted when recording
         if self.is_recording:
-            painter.setPen(QColor(COLORS['error']))
+            painter.setPen(self._RECORDING_COLOR)
         else:
-            painter.setPen(QColor(COLORS['border']))
+            painter.setPen(self._BORDER_COLOR)
         painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 8, 8)
 
         # Level bar with gradient effect
@@ -514,12 +566,12 @@ class AudioLevelWidget(QWidget):
 
             # Color based on level - smooth gradient
             if self.display_level < 0.4:
-                color = QColor(COLORS['success'])
+                color = self._LOW_COLOR
             elif self.display_level < 0.7:
                 # Blend green to yellow
-                color = QColor(COLORS['warning'])
+                color = self._MID_COLOR
             else:
-                color = QColor(COLORS['error'])
+                color = self._HIGH_COLOR
 
             painter.setBrush(color)
             painter.setPen(Qt.NoPen)
@@ -528,11 +580,11 @@ class AudioLevelWidget(QWidget):
         # Peak indicator line
         if self.is_recording and self.peak_level > 0.05:
             peak_x = int(5 + (self.width() - 10) * self.peak_level)
-            painter.setPen(QColor(COLORS['text']))
+            painter.setPen(self._PEAK_COLOR)
             painter.drawLine(peak_x, 6, peak_x, self.height() - 6)
 
         # Level markers (subtler)
-        painter.setPen(QColor(COLORS['border']))
+        painter.setPen(self._BORDER_COLOR)
         for pct in [0.25, 0.5, 0.75]:
             x = int(5 + (self.width() - 10) * pct)
             painter.drawLine(x, 8, x, self.height() - 8)
@@ -544,6 +596,36 @@ class SignalEmitter(QObject):
     status_update = Signal(str)
     recording_state = Signal(bool)
     pause_state = Signal(bool)  # True = paused, False = resumed
+    audio_level = Signal(float)  # Scaled 0.0-1.0 level from the capture thread
+
+
+class WhisperInitWorker(QObject):
+    """Runs WhisperManager.initialize() off the GUI thread"""
+    finished = Signal(bool)  # True if initialization succeeded
+
+    def __init__(self, whisper_manager: WhisperManager):
+        super().__init__()
+        self.whisper_manager = whisper_manager
+
+    def run(self):
+        """Initialize whisper and report the result"""
+        self.finished.emit(self.whisper_manager.initialize())
+
+
+class ModelSwitchWorker(QObject):
+    """Runs WhisperManager.set_model() off the GUI thread"""
+    finished = Signal(bool)  # True if the model was switched
+
+    def __init__(self, whisper_manager: WhisperManager, model_name: str, announce: bool = False):
+        super().__init__()
+        self.whisper_manager = whisper_manager
+        self.model_name = model_name
+        self.announce = announce  # Confirm a successful switch to the user
+
+    def run(self):
+        """Load the model and report the result"""
+        # The config is updated by the GUI thread once the switch has finished
+        self.finished.emit(self.whisper_manager.set_model(self.model_name, update_config=False))
 
 
 class BenchmarkDialog(QDialog):
@@ -560,11 +642,13 @@ class BenchmarkDialog(QDialog):
         error = Signal(str)
 
     def __init__(self, parent, config: ConfigManager, whisper_manager: WhisperManager,
-                 audio_capture: AudioCapture):
+                 audio_capture: AudioCapture, switch_model_callback=None):
         super().__init__(parent)
         self.config = config
         self.whisper_manager = whisper_manager
         self.audio_capture = audio_capture
+        self.switch_model_callback = switch_model_callback
+        self.applied_model = None  # Model handed to switch_model_callback, if any
 
         self.setWindowTitle("Model Benchmark")
         self.setMinimumSize(800, 700)
@@ -910,7 +994,8 @@ class BenchmarkDialog(QDialog):
     def _load_models(self):
         """Load available models into the list"""
         self.models_list.clear()
-        models = self.whisper_manager.get_available_models()
+        # Always rescan: the cache signature does not see files nested deep in finetune folders
+        models = self.whisper_manager.get_available_models(refresh=True)
 
         for model in models:
             item = QListWidgetItem(model)
@@ -997,9 +1082,7 @@ class BenchmarkDialog(QDialog):
         # Get samples
         num_samples = self.samples_spin.value()
         import random
-        self.samples = BENCHMARK_SAMPLES.copy()
-        random.shuffle(self.samples)
-        self.samples = self.samples[:num_samples]
+        self.samples = random.sample(BENCHMARK_SAMPLES, min(num_samples, len(BENCHMARK_SAMPLES)))
 
         # Reset state
         self.recordings = []
@@ -1025,12 +1108,12 @@ class BenchmarkDialog(QDialog):
         self.category_label.setText(f"Category: {sample['category']}")
         self.sample_text.setText(sample['text'])
         self.recording_status.setText("Press Record when ready")
-        self.recording_status.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {COLORS['text']};")
+        set_stylesheet_if_changed(self.recording_status, f"font-size: 16px; font-weight: bold; color: {COLORS['text']};")
         self.duration_label.setText(f"Estimated reading time: ~{sample['estimated_seconds']} seconds")
 
         # Reset record button
         self.record_btn.setText("⏺ Start Recording")
-        self.record_btn.setStyleSheet(f"""
+        set_stylesheet_if_changed(self.record_btn, f"""
             QPushButton {{
                 font-size: 18px;
                 background-color: {COLORS['success']};
@@ -1058,7 +1141,7 @@ class BenchmarkDialog(QDialog):
 
         # Update UI
         self.record_btn.setText("⏹ Stop Recording")
-        self.record_btn.setStyleSheet(f"""
+        set_stylesheet_if_changed(self.record_btn, f"""
             QPushButton {{
                 font-size: 18px;
                 background-color: {COLORS['error']};
@@ -1070,7 +1153,7 @@ class BenchmarkDialog(QDialog):
             }}
         """)
         self.recording_status.setText("Recording...")
-        self.recording_status.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {COLORS['error']};")
+        set_stylesheet_if_changed(self.recording_status, f"font-size: 16px; font-weight: bold; color: {COLORS['error']};")
 
         # Start audio capture
         self.benchmark_audio_meter.set_recording(True)
@@ -1117,7 +1200,7 @@ class BenchmarkDialog(QDialog):
 
         # Update UI immediately
         self.record_btn.setText("⏺ Re-record")
-        self.record_btn.setStyleSheet(f"""
+        set_stylesheet_if_changed(self.record_btn, f"""
             QPushButton {{
                 font-size: 18px;
                 background-color: {COLORS['warning']};
@@ -1129,7 +1212,7 @@ class BenchmarkDialog(QDialog):
             }}
         """)
         self.recording_status.setText("Processing...")
-        self.recording_status.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {COLORS['warning']};")
+        set_stylesheet_if_changed(self.recording_status, f"font-size: 16px; font-weight: bold; color: {COLORS['warning']};")
 
     def _update_audio_level(self):
         """Update the audio level meter"""
@@ -1139,7 +1222,7 @@ class BenchmarkDialog(QDialog):
     def _on_recording_stopped(self, duration: float):
         """Handle recording stopped"""
         self.recording_status.setText(f"Recorded {duration:.1f} seconds")
-        self.recording_status.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {COLORS['success']};")
+        set_stylesheet_if_changed(self.recording_status, f"font-size: 16px; font-weight: bold; color: {COLORS['success']};")
         self.duration_label.setText(f"Recording complete: {duration:.1f}s")
 
         # Enable next button
@@ -1185,12 +1268,10 @@ class BenchmarkDialog(QDialog):
                     duration = rec['duration']
 
                     # Time the transcription
-                    start_time = time.perf_counter()
-                    transcribed = self.whisper_manager.transcribe_audio(audio_data)
-                    end_time = time.perf_counter()
-
-                    inference_time = end_time - start_time
-                    wer = calculate_wer(sample['text'], transcribed)
+                    start_ns = time.perf_counter_ns()
+                    transcribed = self.whisper_manager.transcribe_audio(audio_data, use_cache=False)
+                    inference_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                    wer, edits, ref_word_count = score_transcription(sample['id'], sample['text'], transcribed)
                     rtf = inference_time / duration if duration > 0 else 0
 
                     result = BenchmarkResult(
@@ -1202,7 +1283,9 @@ class BenchmarkDialog(QDialog):
                         inference_time_seconds=inference_time,
                         audio_duration_seconds=duration,
                         real_time_factor=rtf,
-                        timestamp=""
+                        timestamp="",
+                        ref_word_count=ref_word_count,
+                        edit_distance=edits
                     )
                     all_results.append(result)
 
@@ -1210,7 +1293,7 @@ class BenchmarkDialog(QDialog):
                     self.signals.transcription_result.emit(model, wer, inference_time)
 
             # Calculate summaries
-            summaries = self._calculate_summaries(all_results)
+            summaries = summarize_results(all_results)
             self.results = all_results
             self.summaries = summaries
 
@@ -1219,51 +1302,6 @@ class BenchmarkDialog(QDialog):
         self.is_running = True
         threading.Thread(target=run_transcriptions, daemon=True).start()
 
-    def _calculate_summaries(self, results):
-        """Calculate summary statistics for each model"""
-        import numpy as np
-        from dataclasses import asdict
-
-        by_model = {}
-        for r in results:
-            if r.model_name not in by_model:
-                by_model[r.model_name] = []
-            by_model[r.model_name].append(r)
-
-        summaries = {}
-
-        for model_name, model_results in by_model.items():
-            wers = [r.word_error_rate for r in model_results]
-            times = [r.inference_time_seconds for r in model_results]
-            rtfs = [r.real_time_factor for r in model_results]
-            durations = [r.audio_duration_seconds for r in model_results]
-
-            avg_wer = np.mean(wers)
-            avg_time = np.mean(times)
-            avg_rtf = np.mean(rtfs)
-            avg_duration = np.mean(durations)
-
-            efficiency = calculate_efficiency_score(avg_wer, avg_time, avg_duration)
-
-            summaries[model_name] = ModelSummary(
-                model_name=model_name,
-                average_wer=avg_wer,
-                std_wer=np.std(wers) if len(wers) > 1 else 0.0,
-                average_inference_time=avg_time,
-                std_inference_time=np.std(times) if len(times) > 1 else 0.0,
-                average_rtf=avg_rtf,
-                samples_tested=len(model_results),
-                efficiency_score=efficiency,
-                recommendation_rank=0
-            )
-
-        # Rank by efficiency
-        ranked = sorted(summaries.values(), key=lambda s: s.efficiency_score, reverse=True)
-        for i, summary in enumerate(ranked, 1):
-            summaries[summary.model_name].recommendation_rank = i
-
-        return summaries
-
     def _on_sample_started(self, index: int, text: str):
         """Handle sample started signal"""
         pass
@@ -1357,8 +1395,18 @@ class BenchmarkDialog(QDialog):
     def _apply_recommended_model(self):
         """Apply the recommended model as the current model"""
         if hasattr(self, '_recommended_model'):
-            self.config.set_setting('model', self._recommended_model)
-            self.whisper_manager.set_model(self._recommended_model)
+            if self.switch_model_callback:
+                # Saved, confirmed or reported once the model has loaded
+                self.switch_model_callback(self._recommended_model, announce=True)
+                self.applied_model = self._recommended_model
+                return
+
+            if not self.whisper_manager.set_model(self._recommended_model):
+                QMessageBox.warning(
+                    self, "Model Error",
+                    f"Failed to load '{self._recommended_model}'."
+                )
+                return
             self.config.save_config()
             QMessageBox.information(
                 self, "Model Applied",
@@ -1386,6 +1434,20 @@ class SettingsDialog(QDialog):
         self._setup_ui()
         self._load_current_settings()
 
+    def reload(self):
+        """Re-sync the dialog widgets with the current configuration"""
+        shortcuts = self.config.get_all_shortcuts()
+        self.toggle_shortcut_combo.setCurrentText(shortcuts.get('toggle', 'F13'))
+        for name in ('start', 'stop', 'pause'):
+            combo = self.shortcut_combos[name]
+            idx = combo.findText(shortcuts[name]) if shortcuts.get(name) else 0
+            combo.setCurrentIndex(max(idx, 0))
+
+        self._refresh_model_list()
+        self.custom_model_entry.clear()
+        self.new_dir_entry.clear()
+        self._load_current_settings()
+
     def _setup_ui(self):
         """Set up the settings UI"""
         layout = QVBoxLayout(self)
@@ -1626,14 +1688,16 @@ class SettingsDialog(QDialog):
             return
 
         dialog = BenchmarkDialog(
-            self, self.config, self.whisper_manager, self.audio_capture
+            self, self.config, self.whisper_manager, self.audio_capture,
+            self.parent_window.switch_model
         )
         result = dialog.exec()
 
         if result == QDialog.DialogCode.Accepted:
             # Refresh the model list and update display
             self._refresh_model_list()
-            current_model = self.config.get_setting('model')
+            # An applied model may still be loading, so it is not in the config yet
+            current_model = dialog.applied_model or self.config.get_setting('model')
             idx = self.model_combo.findText(current_model)
             if idx >= 0:
                 self.model_combo.setCurrentIndex(idx)
@@ -1645,7 +1709,7 @@ class SettingsDialog(QDialog):
             return
 
         # Get path from whisper manager's cached paths
-        if self.whisper_manager and hasattr(self.whisper_manager, '_model_paths'):
+        if self.whisper_manager:
             path = self.whisper_manager._model_paths.get(model_name, "")
             if path:
                 # Truncate long paths for display
@@ -1687,8 +1751,6 @@ class SettingsDialog(QDialog):
         # Add to whisper manager's model paths
         custom_name = f"[Custom] {custom_path.stem}"
         if self.whisper_manager:
-            if not hasattr(self.whisper_manager, '_model_paths'):
-                self.whisper_manager._model_paths = {}
             self.whisper_manager._model_paths[custom_name] = str(custom_path)
 
         # Refresh the dropdown and select the new model
@@ -1797,7 +1859,8 @@ class SettingsDialog(QDialog):
     def _refresh_model_list(self):
         """Refresh the model dropdown"""
         self.model_combo.clear()
-        models = self.whisper_manager.get_available_models() if self.whisper_manager else []
+        # Always rescan: the cache signature does not see files nested deep in finetune folders
+        models = self.whisper_manager.get_available_models(refresh=True) if self.whisper_manager else []
         if models:
             self.model_combo.addItems(models)
         else:
@@ -1945,9 +2008,11 @@ class SettingsDialog(QDialog):
 
             new_model = self.model_combo.currentText()
             if new_model != "No models found":
-                self.config.set_setting('model', new_model)
                 if self.whisper_manager:
-                    self.whisper_manager.set_model(new_model)
+                    # Stored and saved once the model has loaded
+                    self.parent_window.switch_model(new_model)
+                else:
+                    self.config.set_setting('model', new_model)
 
             if not self.config.save_config():
                 QMessageBox.critical(self, "Error", "Failed to save settings!")
@@ -1985,6 +2050,9 @@ class WhisperTuxApp(QMainWindow):
         self.text_injector = TextInjector(self.config)
         self.global_shortcuts = None
 
+        # In-memory copy of the settings shown in the main window
+        self._refresh_config_snapshot()
+
         # Application state
         self.is_recording = False
         self.is_paused = False
@@ -1996,22 +2064,152 @@ class WhisperTuxApp(QMainWindow):
         self.signals.status_update.connect(self._update_status)
         self.signals.recording_state.connect(self._update_recording_ui)
         self.signals.pause_state.connect(self._update_pause_ui)
+        # These signals are also emitted from the shortcut listener and worker
+        # threads, so they must stay queued. Audio levels arrive for every
+        # capture block; at most one is kept in the event queue at a time.
+        self.signals.audio_level.connect(self._update_audio_level,
+                                         Qt.ConnectionType.QueuedConnection)
+        self._audio_level_pending = False
+
+        # Pause button stylesheets, built once and reused on every toggle
+        self._pause_style_paused = f"""
+            QPushButton {{
+                font-size: 20px;
+                background-color: {COLORS['warning']};
+                color: {COLORS['background']};
+            }}
+            QPushButton:hover {{
+                background-color: #e5d09e;
+            }}
+        """
+        self._pause_style_recording = f"""
+            QPushButton {{
+                font-size: 20px;
+                background-color: {COLORS['surface_light']};
+            }}
+            QPushButton:hover {{
+                background-color: {COLORS['border']};
+            }}
+        """
 
-        # Audio monitoring timer
-        self.audio_timer = QTimer()
-        self.audio_timer.timeout.connect(self._update_audio_level)
+        # Coalesces bursts of settings-change callbacks into a single display update
+        self._display_update_timer = QTimer(self)
+        self._display_update_timer.setSingleShot(True)
+        self._display_update_timer.setInterval(20)
+        self._display_update_timer.timeout.connect(self._do_update_displays)
+
+        # Last object name applied to the record button, used to skip redundant repolishing
+        self._last_record_visual_state = "primary"
+
+        # Display names of microphones, keyed by audio device id
+        self._mic_name_cache = {}
+
+        # Settings dialog, built on first use and reused afterwards
+        self._settings_dialog = None
 
         # System tray
         self.tray_icon = None
+        self._last_tray_state = None
 
         # Set up the UI
         self._setup_ui()
+        self._setup_local_shortcuts()
         self._setup_global_shortcuts()
         self._setup_system_tray()
 
         # Position window
         self._position_window()
 
+        # Recording is enabled once whisper has been initialized
+        self._init_thread = None
+        self._init_worker = None
+        self._switch_thread = None
+        self._switch_worker = None
+        self._pending_model = None
+        self.record_btn.setEnabled(False)
+        self.record_btn.setToolTip("Loading Whisper...")
+
+    def start_whisper_initialization(self):
+        """Initialize whisper on a worker thread so the window can paint first"""
+        self._update_status("Loading...")
+
+        self._init_thread = QThread(self)
+        self._init_worker = WhisperInitWorker(self.whisper_manager)
+        self._init_worker.moveToThread(self._init_thread)
+        self._init_thread.started.connect(self._init_worker.run)
+        self._init_worker.finished.connect(self._on_whisper_ready)
+        self._init_worker.finished.connect(self._init_thread.quit)
+        self._init_thread.start()
+
+    def _on_whisper_ready(self, success: bool):
+        """Enable recording once whisper is initialized, or exit on failure"""
+        if not success:
+            QMessageBox.critical(
+                self,
+                "Initialization Error",
+                "Failed to initialize Whisper. Please ensure whisper.cpp is built.\nRun the build scripts first."
+            )
+            QApplication.exit(1)
+            return
+
+        self.record_btn.setEnabled(True)
+        self.record_btn.setToolTip("Start recording (or use hotkey)")
+        self._update_status("Ready")
+
+    def switch_model(self, model_name: str, announce: bool = False):
+        """Load a different whisper model on a worker thread
+
+        The config is updated and saved on the GUI thread once the model
+        has loaded; announce also confirms success with a message box.
+        """
+        if self._switch_thread is not None:
+            # Picked up once the switch in progress finishes
+            self._pending_model = (model_name, announce)
+            return
+
+        if self.whisper_manager.is_ready() and not self.is_recording:
+            self._update_status("Loading model...")
+
+        self._switch_thread = QThread(self)
+        self._switch_worker = ModelSwitchWorker(self.whisper_manager, model_name, announce)
+        self._switch_worker.moveToThread(self._switch_thread)
+        self._switch_thread.started.connect(self._switch_worker.run)
+        self._switch_worker.finished.connect(self._on_model_switched)
+        self._switch_thread.start()
+
+    def _on_model_switched(self, success: bool):
+        """Release the switch thread, save the new model choice and report the outcome"""
+        model_name = self._switch_worker.model_name
+        announce = self._switch_worker.announce
+        self._switch_thread.quit()
+        self._switch_thread.wait()
+        self._switch_thread.deleteLater()
+        self._switch_thread = None
+        self._switch_worker = None
+
+        # Record whichever model is now loaded, even if another switch follows
+        if success:
+            self.whisper_manager.store_model_setting(model_name)
+            if not self.config.save_config():
+                QMessageBox.critical(self, "Error", "Failed to save settings!")
+
+        if self._pending_model is not None:
+            pending_name, pending_announce = self._pending_model
+            self._pending_model = None
+            self.switch_model(pending_name, pending_announce)
+            return
+
+        if not success:
+            QMessageBox.warning(self, "Model Error", f"Failed to load '{model_name}'.")
+        elif announce:
+            QMessageBox.information(
+                self, "Model Applied",
+                f"'{model_name}' is now your active model."
+            )
+        if self.whisper_manager.is_ready() and not self.is_recording:
+            self._update_status("Ready")
+        self._on_settings_changed()
+
     def _setup_ui(self):
         """Set up the main UI"""
         self.setWindowTitle("Wayland Voice Typer")
@@ -2253,11 +2451,14 @@ class WhisperTuxApp(QMainWindow):
         layout.addLayout(header_layout)
 
         # Transcription text area with better readability
-        self.transcription_text = QTextEdit()
+        # QPlainTextEdit trims old lines itself once the block limit is reached
+        self.transcription_text = QPlainTextEdit()
         self.transcription_text.setReadOnly(True)
+        self.transcription_text.setMaximumBlockCount(MAX_TRANSCRIPTION_BLOCKS)
+        self.transcription_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         self.transcription_text.setPlaceholderText("Transcriptions will appear here...\nUse your hotkey or click the record button to start.")
         self.transcription_text.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {COLORS['surface']};
                 color: {COLORS['text']};
                 border: 1px solid {COLORS['border']};
@@ -2267,7 +2468,7 @@ class WhisperTuxApp(QMainWindow):
                 font-family: 'Noto Sans', 'Segoe UI', sans-serif;
                 line-height: 1.5;
             }}
-            QTextEdit:focus {{
+            QPlainTextEdit:focus {{
                 border-color: {COLORS['primary']};
             }}
         """)
@@ -2374,6 +2575,13 @@ class WhisperTuxApp(QMainWindow):
             seconds = int(elapsed % 60)
             self.duration_label.setText(f"{minutes}:{seconds:02d}")
 
+    def _setup_local_shortcuts(self):
+        """Set up keyboard shortcuts that apply while the window is focused"""
+        # Ctrl+C: Copy transcription to clipboard
+        QShortcut(QKeySequence("Ctrl+C"), self, activated=self._copy_transcription)
+        # Ctrl+S: Start/Stop recording
+        QShortcut(QKeySequence("Ctrl+S"), self, activated=self._toggle_recording)
+
     def _setup_global_shortcuts(self):
         """Set up global keyboard shortcuts"""
         try:
@@ -2412,6 +2620,7 @@ class WhisperTuxApp(QMainWindow):
         # Create tray icons for different states
         self._create_tray_icons()
         self.tray_icon.setIcon(self.tray_icon_idle)
+        self._last_tray_state = False
 
         # Create menu
         tray_menu = QMenu()
@@ -2460,9 +2669,10 @@ class WhisperTuxApp(QMainWindow):
 
     def _update_tray_icon(self, is_recording: bool):
         """Update the system tray icon based on recording state"""
-        if not self.tray_icon:
+        if not self.tray_icon or is_recording == self._last_tray_state:
             return
 
+        self._last_tray_state = is_recording
         if is_recording:
             self.tray_icon.setIcon(self.tray_icon_recording)
         else:
@@ -2475,16 +2685,22 @@ class WhisperTuxApp(QMainWindow):
 
     def _get_current_mic_name(self):
         """Get the current microphone name"""
+        device_id = getattr(self.audio_capture, 'device_id', None)
+        if device_id in self._mic_name_cache:
+            return self._mic_name_cache[device_id]
+
+        name = "default"
         try:
             info = self.audio_capture.get_current_device_info()
             if info:
                 name = info['name']
                 if len(name) > 35:
                     name = name[:32] + "..."
-                return name
         except:
             pass
-        return "default"
+
+        self._mic_name_cache[device_id] = name
+        return name
 
     def _toggle_recording(self):
         """Toggle recording state"""
@@ -2503,7 +2719,7 @@ class WhisperTuxApp(QMainWindow):
 
     def _start_recording(self):
         """Start recording"""
-        if self.is_recording or self.is_processing:
+        if self.is_recording or self.is_processing or not self.whisper_manager.is_ready():
             return
 
         try:
@@ -2514,9 +2730,9 @@ class WhisperTuxApp(QMainWindow):
             if self.config.get_setting('audio_feedback', True):
                 threading.Thread(target=AudioFeedback.play_start_beep, daemon=True).start()
 
-            # Start audio monitoring
+            # Start audio monitoring - levels are pushed from the capture thread
             self.audio_meter.set_recording(True)
-            self.audio_timer.start(50)
+            self.audio_capture.recording_level_callback = self._on_capture_level
 
             def record_audio():
                 try:
@@ -2546,7 +2762,7 @@ class WhisperTuxApp(QMainWindow):
             threading.Thread(target=AudioFeedback.play_stop_beep, daemon=True).start()
 
         # Stop audio monitoring
-        self.audio_timer.stop()
+        self.audio_capture.recording_level_callback = None
         self.audio_meter.set_recording(False)
 
         def process_recording():
@@ -2567,9 +2783,16 @@ class WhisperTuxApp(QMainWindow):
 
         threading.Thread(target=process_recording, daemon=True).start()
 
-    def _update_audio_level(self):
+    def _on_capture_level(self, level: float):
+        """Forward a level from the audio callback thread to the GUI thread"""
+        if self._audio_level_pending:
+            return
+        self._audio_level_pending = True
+        self.signals.audio_level.emit(AudioCapture.scale_level(level))
+
+    def _update_audio_level(self, level: float):
         """Update audio level meter"""
-        level = self.audio_capture.get_audio_level()
+        self._audio_level_pending = False
         self.audio_meter.set_level(level)
 
     def _handle_transcription(self, transcription: str):
@@ -2584,8 +2807,13 @@ class WhisperTuxApp(QMainWindow):
             is_blank = any(indicator.lower() in cleaned.lower() for indicator in blank_indicators)
 
             if not is_blank:
-                # Show in text area for reference
-                self.transcription_text.append(cleaned)
+                # Show in text area for reference, cropping huge single transcriptions
+                if len(cleaned) > MAX_TRANSCRIPTION_DISPLAY_CHARS:
+                    self.transcription_text.appendPlainText(
+                        cleaned[:MAX_TRANSCRIPTION_DISPLAY_CHARS] + " …[truncated]"
+                    )
+                else:
+                    self.transcription_text.appendPlainText(cleaned)
 
                 # Inject text as a single batch operation (not character-by-character streaming)
                 # This waits for full transcription then types it all at once
@@ -2605,11 +2833,22 @@ class WhisperTuxApp(QMainWindow):
         """Reset the record button to ready state"""
         self.record_btn.setText("⏺")
         self.record_btn.setToolTip("Start recording")
-        self.record_btn.setObjectName("primary")
+        self._set_record_visual_state("primary")
         self.record_btn.setEnabled(True)
-        self.record_btn.setStyle(self.record_btn.style())
         self.pause_btn.setVisible(False)
 
+    def _set_record_visual_state(self, state: str):
+        """Apply a record button style selector, repolishing only when it changes"""
+        if state == self._last_record_visual_state:
+            return
+
+        self._last_record_visual_state = state
+        self.record_btn.setObjectName(state)
+        style = self.record_btn.style()
+        style.unpolish(self.record_btn)
+        style.polish(self.record_btn)
+        self.record_btn.update()
+
     def _update_status(self, status: str):
         """Update status display with color-coded background"""
         self.status_label.setText(status)
@@ -2628,7 +2867,7 @@ class WhisperTuxApp(QMainWindow):
             bg_color = COLORS['surface_light']
             text_color = COLORS['success']
 
-        self.status_label.setStyleSheet(f"""
+        set_stylesheet_if_changed(self.status_label, f"""
             QLabel {{
                 font-size: 18px;
                 font-weight: bold;
@@ -2649,7 +2888,7 @@ class WhisperTuxApp(QMainWindow):
             # Use stop symbol ⏹ when recording
             self.record_btn.setText("⏹")
             self.record_btn.setToolTip("Stop recording")
-            self.record_btn.setObjectName("recording")
+            self._set_record_visual_state("recording")
             self.pause_btn.setVisible(True)
             # Start duration timer
             self.recording_start_time = time.time()
@@ -2669,7 +2908,7 @@ class WhisperTuxApp(QMainWindow):
             # Use record symbol ⏺ when ready
             self.record_btn.setText("⏺")
             self.record_btn.setToolTip("Start recording (or use hotkey)")
-            self.record_btn.setObjectName("primary")
+            self._set_record_visual_state("primary")
             self.record_btn.setEnabled(True)
             self.pause_btn.setVisible(False)
             self.is_paused = False
@@ -2679,9 +2918,6 @@ class WhisperTuxApp(QMainWindow):
             self.recording_start_time = None
             self._update_status("Ready")
 
-        # Force style update
-        self.record_btn.setStyle(self.record_btn.style())
-
         # Update tray icon based on recording state
         self._update_tray_icon(is_recording)
 
@@ -2691,38 +2927,27 @@ class WhisperTuxApp(QMainWindow):
             # Use play symbol ▶ to indicate "click to resume"
             self.pause_btn.setText("▶")
             self.pause_btn.setToolTip("Resume recording")
-            self.pause_btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-size: 20px;
-                    background-color: {COLORS['warning']};
-                    color: {COLORS['background']};
-                }}
-                QPushButton:hover {{
-                    background-color: #e5d09e;
-                }}
-            """)
+            set_stylesheet_if_changed(self.pause_btn, self._pause_style_paused)
             self._update_status("Paused")
         else:
             # Use pause symbol ⏸
             self.pause_btn.setText("⏸")
             self.pause_btn.setToolTip("Pause recording")
-            self.pause_btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-size: 20px;
-                    background-color: {COLORS['surface_light']};
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['border']};
-                }}
-            """)
+            set_stylesheet_if_changed(self.pause_btn, self._pause_style_recording)
             if self.is_recording:
                 self._update_status("Recording...")
 
     def _copy_transcription(self):
         """Copy transcription to clipboard"""
-        text = self.transcription_text.toPlainText()
-        if text:
-            QApplication.clipboard().setText(text)
+        if self.transcription_text.document().isEmpty():
+            return
+
+        # Let Qt copy the whole document itself instead of materializing it
+        # as a Python string, then restore the user's cursor/selection
+        saved_cursor = self.transcription_text.textCursor()
+        self.transcription_text.selectAll()
+        self.transcription_text.copy()
+        self.transcription_text.setTextCursor(saved_cursor)
 
     def _clear_transcription(self):
         """Clear transcription text"""
@@ -2730,86 +2955,110 @@ class WhisperTuxApp(QMainWindow):
 
     def _show_settings(self):
         """Show settings dialog"""
-        dialog = SettingsDialog(self, self.config, self.global_shortcuts,
-                                 self.whisper_manager, self._update_displays,
-                                 self.audio_capture)
-        dialog.exec()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self, self.config, self.global_shortcuts,
+                                                   self.whisper_manager, self._on_settings_changed,
+                                                   self.audio_capture)
+        else:
+            self._settings_dialog.reload()
+        self._settings_dialog.exec()
+
+    def _refresh_config_snapshot(self):
+        """Take a fresh copy of the settings and shortcuts used by the display labels"""
+        self._config_snapshot = self.config.get_all_settings()
+        self._shortcuts_snapshot = self.config.get_all_shortcuts()
+
+    def _on_settings_changed(self):
+        """Re-snapshot the settings after they change (settings dialog, model switch) and refresh the labels"""
+        self._refresh_config_snapshot()
+        self._update_displays()
 
     def _update_displays(self):
-        """Update all display labels from config"""
-        self.model_display.setText(self.config.get_setting('model', 'large-v3'))
-        # Show toggle shortcut in main display
-        shortcuts = self.config.get_all_shortcuts()
-        toggle_key = shortcuts.get('toggle', 'F13')
-        self.shortcut_display.setText(toggle_key)
-        self.delay_display.setText(f"{self.config.get_setting('key_delay', 15)}ms delay")
-        self.mic_display.setText(self._get_current_mic_name())
+        """Schedule a display refresh; repeated calls within 20ms are merged"""
+        self._display_update_timer.start()
 
-        # Update always on top
-        if self.config.get_setting('always_on_top', True):
-            self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+    def _do_update_displays(self):
+        """Update all display labels from the settings snapshot"""
+        snapshot = self._config_snapshot
+
+        self._set_label_text(self.model_display, snapshot.get('model', 'large-v3'))
+        # Show toggle shortcut in main display
+        toggle_key = self._shortcuts_snapshot.get('toggle', 'F13')
+        self._set_label_text(self.shortcut_display, toggle_key)
+        self._set_label_text(self.delay_display, f"{snapshot.get('key_delay', 15)}ms delay")
+        self._set_label_text(self.mic_display, self._get_current_mic_name())
+
+        # Update always on top - changing window flags recreates the native
+        # window, so only do it when the flag actually changed
+        current_flags = self.windowFlags()
+        if snapshot.get('always_on_top', True):
+            desired_flags = current_flags | Qt.WindowType.WindowStaysOnTopHint
         else:
-            self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowStaysOnTopHint)
-        self.show()
-
-    def keyPressEvent(self, event):
-        """Handle keyboard shortcuts when app is focused"""
-        if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            if event.key() == Qt.Key.Key_C:
-                # Ctrl+C: Copy transcription to clipboard
-                self._copy_transcription()
-                event.accept()
-                return
-            elif event.key() == Qt.Key.Key_S:
-                # Ctrl+S: Start/Stop recording
-                self._toggle_recording()
-                event.accept()
-                return
-        super().keyPressEvent(event)
+            desired_flags = current_flags & ~Qt.WindowType.WindowStaysOnTopHint
+        if desired_flags != current_flags:
+            self.setWindowFlags(desired_flags)
+            self.show()
+
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set label text only if it differs, avoiding needless repaints"""
+        if label.text() != text:
+            label.setText(text)
 
     def closeEvent(self, event):
         """Handle window close"""
         try:
-            if self.global_shortcuts:
-                self.global_shortcuts.stop()
+            # Let whisper initialization or a model switch in progress finish
+            # so their threads are not destroyed while still running
+            self._pending_model = None
+            for thread in (self._init_thread, self._switch_thread):
+                if thread is not None:
+                    thread.quit()
+                    thread.wait()
 
-            if self.is_recording:
-                self.audio_capture.stop_recording()
+            # Shortcut listener and recording thread both join with timeouts,
+            # so stop them in parallel rather than one after the other
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                if self.global_shortcuts:
+                    executor.submit(self.global_shortcuts.stop)
 
-            self.audio_timer.stop()
+                if self.is_recording:
+                    executor.submit(self.audio_capture.stop_recording)
 
-            if self.tray_icon:
-                self.tray_icon.hide()
+                self.audio_capture.recording_level_callback = None
 
-            self.config.save_config()
+                if self.tray_icon:
+                    self.tray_icon.hide()
 
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
+            if self.config.is_dirty():
+                self.config.save_config()
+
+        except Exception:
+            logger.exception("Error during cleanup")
 
         event.accept()
 
 
 def main():
     """Main entry point"""
+    logging.basicConfig(level=logging.WARNING)
+
     if not sys.platform.startswith('linux'):
         print("Warning: This application is designed for Linux systems")
 
-    app = QApplication(sys.argv)
+    # Reuse an existing instance (e.g. IPython Qt integration) instead of failing
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion")  # Use Fusion style for consistent look
     app.setApplicationName("Wayland Voice Typer")
-    app.setStyle("Fusion")  # Use Fusion style for consistent look
 
     window = WhisperTuxApp()
+    window.show()
 
-    # Initialize whisper
-    if not window.whisper_manager.initialize():
-        QMessageBox.critical(
-            None,
-            "Initialization Error",
-            "Failed to initialize Whisper. Please ensure whisper.cpp is built.\nRun the build scripts first."
-        )
-        sys.exit(1)
+    # Initialize whisper in the background; recording is enabled when it finishes
+    window.start_whisper_initialization()
 
-    window.show()
     sys.exit(app.exec())
 
 
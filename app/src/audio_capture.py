@@ -29,8 +29,12 @@ class AudioCapture:
         self.is_recording = False
         self.is_paused = False
         self.is_monitoring = False
-        self.audio_data = []
         self.current_level = 0.0
+
+        # Preallocated capture buffer, filled in place by the audio callback
+        self.initial_buffer_seconds = 60
+        self._buffer = None
+        self._buffer_len = 0
         
         # Threading
         self.record_thread = None
@@ -38,7 +42,8 @@ class AudioCapture:
         self.lock = threading.Lock()
         
         # Callbacks
-        self.level_callback = None
+        self.level_callback = None  # Level monitoring (start_monitoring)
+        self.recording_level_callback = None  # Raw RMS level of each recorded block
         
         # Audio stream
         self.stream = None
@@ -268,9 +273,10 @@ class AudioCapture:
             return True
         
         try:
-            # Clear previous audio data
+            # Fresh buffer per recording: the previous one may still be held by the caller
             with self.lock:
-                self.audio_data = []
+                self._buffer = np.empty(self.sample_rate * self.initial_buffer_seconds, dtype=np.float32)
+                self._buffer_len = 0
                 self.is_recording = True
             
             # Start recording thread
@@ -336,14 +342,33 @@ class AudioCapture:
         
         # Return recorded data
         with self.lock:
-            if self.audio_data:
-                # Concatenate all audio chunks
-                audio_array = np.concatenate(self.audio_data, axis=0)
-                print(f"Recording stopped, captured {len(audio_array)} samples")
-                return audio_array
-            else:
-                print("No audio data recorded")
-                return None
+            buffer, length = self._buffer, self._buffer_len
+            self._buffer = None
+            self._buffer_len = 0
+
+        if buffer is None or length == 0:
+            print("No audio data recorded")
+            return None
+
+        # Hand out a view of the buffer; copy only when most of it is unused
+        # so short recordings don't pin a full-size allocation
+        if length * 2 < len(buffer):
+            audio_array = buffer[:length].copy()
+        else:
+            audio_array = buffer[:length]
+        print(f"Recording stopped, captured {length} samples")
+        return audio_array
+
+    def _append_to_buffer(self, audio_chunk: np.ndarray):
+        """Copy a chunk into the capture buffer, doubling it when full (caller holds the lock)"""
+        start = self._buffer_len
+        end = start + len(audio_chunk)
+        if end > len(self._buffer):
+            grown = np.empty(max(end, len(self._buffer) * 2), dtype=np.float32)
+            grown[:start] = self._buffer[:start]
+            self._buffer = grown
+        self._buffer[start:end] = audio_chunk
+        self._buffer_len = end
     
     def _record_audio(self):
         """Internal method to record audio in a separate thread"""
@@ -353,17 +378,23 @@ class AudioCapture:
                 if status:
                     print(f"Audio callback status: {status}")
 
+                level = None
                 with self.lock:
                     if self.is_recording:
                         # Store the audio data (indata is already numpy array)
                         audio_chunk = indata[:, 0]  # Get mono channel
 
                         # Update current audio level for monitoring (even when paused)
-                        self.current_level = np.sqrt(np.mean(audio_chunk**2))
+                        self.current_level = level = np.sqrt(np.mean(audio_chunk**2))
 
                         # Only store audio data if not paused
-                        if not self.is_paused:
-                            self.audio_data.append(audio_chunk.copy())
+                        if not self.is_paused and self._buffer is not None:
+                            self._append_to_buffer(audio_chunk)
+
+                # Push the new level to any listener (outside the lock)
+                callback = self.recording_level_callback
+                if callback and level is not None:
+                    callback(level)
             
             # Determine device to use for recording
             device_to_use = self.preferred_device_id if self.preferred_device_id is not None else None
@@ -456,7 +487,12 @@ class AudioCapture:
     
     def get_audio_level(self) -> float:
         """Get the current audio level (0.0 to 1.0)"""
-        return min(1.0, self.current_level * 10)  # Scale for better visualization
+        return self.scale_level(self.current_level)
+
+    @staticmethod
+    def scale_level(level: float) -> float:
+        """Scale a raw RMS level to 0.0-1.0 for display"""
+        return min(1.0, level * 10)  # Scale for better visualization
     
     def _cleanup_stream(self):
         """Clean up the audio stream"""
@@ -4,25 +4,49 @@ Evaluates models for optimal WER vs inference time trade-off
 """
 
 import json
+import sys
 import time
 import random
 import tempfile
 import wave
 import os
+from array import array
+from types import MappingProxyType
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Dict, Mapping, Tuple
 import numpy as np
 
+# Optional C++ edit distance (much faster than the pure-Python fallback)
 try:
-    from .whisper_manager import WhisperManager
-    from .config_manager import ConfigManager
-    from .audio_capture import AudioCapture
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+# Optional fast JSON encoder for saving results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional libsndfile reader, decodes WAVs straight into float32
+try:
+    import soundfile as sf
 except ImportError:
-    from whisper_manager import WhisperManager
-    from config_manager import ConfigManager
-    from audio_capture import AudioCapture
+    sf = None
+
+# Numba-compiled edit distance kernel, resolved lazily on first use
+# (None = not tried yet, False = numba unavailable)
+_numba_edit_distance = None
+
+# WhisperManager, ConfigManager and AudioCapture are imported where they are
+# first needed, so `--help` and importing this module just for calculate_wer
+# do not pull in the whisper/sounddevice stack
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
 
 
 # Text samples for benchmark reading - approximately 20-30 seconds each when read aloud
@@ -129,6 +153,20 @@ BENCHMARK_SAMPLES = [
     },
 ]
 
+def tokenize_words(text: str) -> List[str]:
+    """Lowercase and split text into interned words so DP comparisons are mostly identity checks"""
+    return [sys.intern(w) for w in text.lower().split()]
+
+
+# Read-only reference text per built-in sample id
+_REF_TEXT_BY_ID = MappingProxyType({s['id']: s['text'] for s in BENCHMARK_SAMPLES})
+
+# Normalized reference words per built-in sample, so the benchmark loop does
+# not re-split the same text for every model
+_REF_TOKENS: Dict[str, Tuple[str, List[str]]] = {
+    s['id']: (s['text'], tokenize_words(s['text'])) for s in BENCHMARK_SAMPLES
+}
+
 
 @dataclass
 class BenchmarkResult:
@@ -142,13 +180,15 @@ class BenchmarkResult:
     audio_duration_seconds: float
     real_time_factor: float  # inference_time / audio_duration (< 1 means faster than real-time)
     timestamp: str
+    ref_word_count: int = 0  # Words in the normalized reference
+    edit_distance: int = 0  # Word-level substitutions + insertions + deletions
 
 
 @dataclass
 class ModelSummary:
     """Aggregated results for a model across all samples"""
     model_name: str
-    average_wer: float
+    average_wer: float  # Corpus WER: total word errors / total reference words
     std_wer: float
     average_inference_time: float
     std_inference_time: float
@@ -171,39 +211,221 @@ def calculate_wer(reference: str, hypothesis: str) -> float:
     Returns:
         WER as a float between 0.0 and potentially > 1.0 (if many insertions)
     """
-    # Normalize texts: lowercase, strip, split into words
-    ref_words = reference.lower().strip().split()
-    hyp_words = hypothesis.lower().strip().split()
+    return calculate_wer_tokens(tokenize_words(reference), hypothesis)
+
+
+def reference_tokens(sample_id: str, reference_text: str) -> List[str]:
+    """Return the normalized reference words, reusing the cached split for built-in samples"""
+    cached = _REF_TOKENS.get(sample_id)
+    if cached is not None and cached[0] == reference_text:
+        return cached[1]
+    return tokenize_words(reference_text)
+
+
+def score_transcription(sample_id: str, reference_text: str, transcribed_text: str) -> Tuple[float, int, int]:
+    """
+    Score a transcription against its reference.
+
+    Args:
+        sample_id: ID of the sample (reuses the cached reference split)
+        reference_text: Ground truth text
+        transcribed_text: Transcribed text to evaluate
+
+    Returns:
+        (WER, word edit distance, reference word count); the raw counts
+        allow corpus-level WER
+    """
+    ref_words = reference_tokens(sample_id, reference_text)
+    edit_distance = count_word_errors(ref_words, tokenize_words(transcribed_text))
+    if ref_words:
+        wer = edit_distance / len(ref_words)
+    else:
+        wer = 1.0 if edit_distance > 0 else 0.0
+    return wer, edit_distance, len(ref_words)
+
+
+def calculate_wer_tokens(ref_words: List[str], hypothesis: str) -> float:
+    """
+    Calculate WER against an already normalized and split reference.
+
+    Args:
+        ref_words: Lowercased reference words
+        hypothesis: Transcribed text to evaluate
+
+    Returns:
+        WER as a float between 0.0 and potentially > 1.0 (if many insertions)
+    """
+    hyp_words = tokenize_words(hypothesis)
 
     if len(ref_words) == 0:
         return 1.0 if len(hyp_words) > 0 else 0.0
 
-    # Dynamic programming for edit distance
-    m, n = len(ref_words), len(hyp_words)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    if len(hyp_words) == 0:
+        return 1.0
+
+    wer = count_word_errors(ref_words, hyp_words) / len(ref_words)
+
+    return wer
+
+
+def count_word_errors(ref_words: List[str], hyp_words: List[str]) -> int:
+    """
+    Count word-level substitutions, insertions and deletions.
+
+    Args:
+        ref_words: Normalized reference words
+        hyp_words: Normalized hypothesis words
+
+    Returns:
+        Word-level Levenshtein distance
+    """
+    # Easy samples often come back verbatim
+    if ref_words == hyp_words:
+        return 0
 
-    # Initialize base cases
-    for i in range(m + 1):
-        dp[i][0] = i  # Deletions
+    # Matching leading/trailing words never contribute edits, so only the
+    # differing middle needs the DP
+    m, n = len(ref_words), len(hyp_words)
+    prefix = 0
+    while prefix < m and prefix < n and ref_words[prefix] == hyp_words[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < m - prefix and suffix < n - prefix
+           and ref_words[m - 1 - suffix] == hyp_words[n - 1 - suffix]):
+        suffix += 1
+    if prefix or suffix:
+        ref_words = ref_words[prefix:m - suffix]
+        hyp_words = hyp_words[prefix:n - suffix]
+
+    if not ref_words or not hyp_words:
+        return len(ref_words) + len(hyp_words)
+
+    if Levenshtein is not None:
+        return Levenshtein.distance(ref_words, hyp_words)
+
+    kernel = _get_numba_edit_distance()
+    if kernel:
+        return _numba_word_edit_distance(kernel, ref_words, hyp_words)
+    return _word_edit_distance(ref_words, hyp_words)
+
+
+def _edit_distance_ids(ref_ids: np.ndarray, hyp_ids: np.ndarray, row: np.ndarray) -> int:
+    """Levenshtein distance over integer token ids using a single rolling row (Numba kernel)"""
+    n = hyp_ids.shape[0]
     for j in range(n + 1):
-        dp[0][j] = j  # Insertions
+        row[j] = j
 
-    # Fill the DP table
-    for i in range(1, m + 1):
+    for i in range(1, ref_ids.shape[0] + 1):
+        diagonal = row[0]
+        row[0] = i
+        ref_id = ref_ids[i - 1]
         for j in range(1, n + 1):
-            if ref_words[i-1] == hyp_words[j-1]:
-                dp[i][j] = dp[i-1][j-1]  # No operation needed
+            above = row[j]
+            if ref_id == hyp_ids[j - 1]:
+                value = diagonal
+            else:
+                value = 1 + min(above, row[j - 1], diagonal)
+            diagonal = above
+            row[j] = value
+
+    return row[n]
+
+
+def _get_numba_edit_distance():
+    """Return the JIT-compiled edit distance kernel, or False if numba is not installed"""
+    global _numba_edit_distance
+    if _numba_edit_distance is None:
+        try:
+            from numba import njit
+            _numba_edit_distance = njit(cache=True)(_edit_distance_ids)
+        except ImportError:
+            _numba_edit_distance = False
+    return _numba_edit_distance
+
+
+def _numba_word_edit_distance(kernel, ref_words: List[str], hyp_words: List[str]) -> int:
+    """Map words to integer ids and run the compiled edit distance kernel"""
+    vocab: Dict[str, int] = {}
+    ref_ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in ref_words),
+                          dtype=np.int32, count=len(ref_words))
+    hyp_ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in hyp_words),
+                          dtype=np.int32, count=len(hyp_words))
+    row = np.empty(len(hyp_words) + 1, dtype=np.int32)
+    return int(kernel(ref_ids, hyp_ids, row))
+
+
+def _word_edit_distance(ref_words: List[str], hyp_words: List[str]) -> int:
+    """
+    Word-level Levenshtein distance (pure-Python fallback).
+
+    Uses Ukkonen's banded algorithm: only cells within k of the diagonal are
+    computed, doubling k until the result fits inside the band. Transcripts
+    are usually close to the reference, so this is roughly O(n * d) instead
+    of O(m * n).
+    """
+    m, n = len(ref_words), len(hyp_words)
+    k = max(abs(m - n), 1)
+
+    while True:
+        distance = _banded_edit_distance(ref_words, hyp_words, k)
+        if distance <= k or k >= max(m, n):
+            return distance
+        k *= 2
+
+
+def _banded_edit_distance(ref_words: List[str], hyp_words: List[str], k: int) -> int:
+    """Edit distance restricted to a diagonal band of width k (values > k are capped)"""
+    m, n = len(ref_words), len(hyp_words)
+    out_of_band = k + 1
+
+    # Two rolling rows instead of the full (m+1) x (n+1) table
+    prev = array('i', [j if j <= k else out_of_band for j in range(n + 1)])
+    cur = array('i', [out_of_band] * (n + 1))
+
+    for i in range(1, m + 1):
+        lo = max(1, i - k)
+        hi = min(n, i + k)
+
+        cur[0] = i if i <= k else out_of_band  # Deletions
+        if lo > 1:
+            cur[lo - 1] = out_of_band
+
+        ref_word = ref_words[i - 1]
+        for j in range(lo, hi + 1):
+            if ref_word == hyp_words[j - 1]:
+                value = prev[j - 1]  # No operation needed
             else:
-                dp[i][j] = 1 + min(
-                    dp[i-1][j],      # Deletion
-                    dp[i][j-1],      # Insertion
-                    dp[i-1][j-1]     # Substitution
+                value = 1 + min(
+                    prev[j],      # Deletion
+                    cur[j - 1],   # Insertion
+                    prev[j - 1]   # Substitution
                 )
+            cur[j] = value if value < out_of_band else out_of_band
 
-    edit_distance = dp[m][n]
-    wer = edit_distance / len(ref_words)
+        if hi < n:
+            cur[hi + 1] = out_of_band
+
+        prev, cur = cur, prev
+
+    return prev[n]
+
+
+# Column length up to which summary statistics are computed in plain Python
+_SMALL_STATS_MAX = 32
 
-    return wer
+
+def _mean_std(values: List[float]) -> Tuple[float, float]:
+    """Mean and population standard deviation of a short list (std is 0.0 below two values)"""
+    count = len(values)
+    mean = sum(values) / count
+    if count < 2:
+        return mean, 0.0
+    return mean, (sum((x - mean) ** 2 for x in values) / count) ** 0.5
+
+
+def _new_result_columns() -> Dict[str, List[float]]:
+    """Empty per-model numeric result columns"""
+    return {'wer': [], 'time': [], 'rtf': [], 'dur': [], 'edits': [], 'ref_words': []}
 
 
 def calculate_efficiency_score(wer: float, inference_time: float, audio_duration: float) -> float:
@@ -254,16 +476,102 @@ def calculate_efficiency_score(wer: float, inference_time: float, audio_duration
     return efficiency
 
 
+def _append_result_columns(cols: Dict[str, List[float]], result: BenchmarkResult):
+    """Append a result's numeric fields to its model's columns"""
+    cols['wer'].append(result.word_error_rate)
+    cols['time'].append(result.inference_time_seconds)
+    cols['rtf'].append(result.real_time_factor)
+    cols['dur'].append(result.audio_duration_seconds)
+    cols['edits'].append(result.edit_distance)
+    cols['ref_words'].append(result.ref_word_count)
+
+
+def summarize_results(results: List[BenchmarkResult]) -> Dict[str, ModelSummary]:
+    """
+    Calculate ranked per-model summary statistics for a list of results.
+
+    Args:
+        results: Benchmark results, any number per model
+
+    Returns:
+        Dict of model name to ModelSummary, ranked by efficiency score
+    """
+    columns = defaultdict(_new_result_columns)
+    for result in results:
+        _append_result_columns(columns[result.model_name], result)
+    return _summarize_columns(columns)
+
+
+def _summarize_columns(columns: Dict[str, Dict[str, List[float]]]) -> Dict[str, ModelSummary]:
+    """Summarize per-model result columns and rank the models by efficiency"""
+    summaries: Dict[str, ModelSummary] = {}
+
+    for model_name, cols in columns.items():
+        count = len(cols['wer'])
+        if count == 0:
+            continue
+
+        if count <= _SMALL_STATS_MAX:
+            # Typical sessions have a handful of samples; plain Python beats
+            # NumPy's per-call dispatch overhead at this size
+            mean_wer, std_wer = _mean_std(cols['wer'])
+            avg_time, std_time = _mean_std(cols['time'])
+            avg_rtf = sum(cols['rtf']) / count
+            avg_duration = sum(cols['dur']) / count
+        else:
+            stats = np.array(
+                [cols['wer'], cols['time'], cols['rtf'], cols['dur']], dtype=np.float64
+            )
+            mean_wer, avg_time, avg_rtf, avg_duration = stats.mean(axis=1).tolist()
+            std_wer, std_time = stats[:2].std(axis=1).tolist()
+
+        # Corpus WER so long references are not outweighed by short ones
+        total_ref_words = sum(cols['ref_words'])
+        if total_ref_words > 0:
+            avg_wer = sum(cols['edits']) / total_ref_words
+        else:
+            avg_wer = mean_wer
+
+        # Calculate efficiency score using averages
+        efficiency = calculate_efficiency_score(avg_wer, avg_time, avg_duration)
+
+        summaries[model_name] = ModelSummary(
+            model_name=model_name,
+            average_wer=avg_wer,
+            std_wer=std_wer,
+            average_inference_time=avg_time,
+            std_inference_time=std_time,
+            average_rtf=avg_rtf,
+            samples_tested=count,
+            efficiency_score=efficiency,
+            recommendation_rank=0  # Will be set after sorting
+        )
+
+    # Rank by efficiency score
+    ranked = sorted(summaries.values(), key=lambda s: s.efficiency_score, reverse=True)
+    for i, summary in enumerate(ranked, 1):
+        summaries[summary.model_name].recommendation_rank = i
+
+    return summaries
+
+
 class WhisperBenchmark:
     """Benchmark utility for comparing Whisper models"""
 
-    def __init__(self, config_manager: Optional[ConfigManager] = None):
+    def __init__(self, config_manager: Optional["ConfigManager"] = None):
         """
         Initialize the benchmark utility.
 
         Args:
             config_manager: Optional ConfigManager instance, creates new one if not provided
         """
+        try:
+            from .whisper_manager import WhisperManager
+            from .config_manager import ConfigManager
+        except ImportError:
+            from whisper_manager import WhisperManager
+            from config_manager import ConfigManager
+
         self.config = config_manager or ConfigManager()
         self.whisper = WhisperManager(self.config)
         self.audio_capture = None  # Initialize on demand
@@ -275,6 +583,10 @@ class WhisperBenchmark:
         # Current session results
         self.current_results: List[BenchmarkResult] = []
 
+        # Numeric result columns per model, appended as results arrive so the
+        # summary pass reduces contiguous arrays instead of walking dataclasses
+        self._cols: Dict[str, Dict[str, List[float]]] = defaultdict(_new_result_columns)
+
     def initialize(self) -> bool:
         """Initialize the benchmark system"""
         if not self.whisper.initialize():
@@ -297,12 +609,12 @@ class WhisperBenchmark:
         Returns:
             List of sample dictionaries with 'id', 'text', 'category', 'estimated_seconds'
         """
-        samples = BENCHMARK_SAMPLES.copy()
+        count = min(count, len(BENCHMARK_SAMPLES))
 
         if shuffle:
-            random.shuffle(samples)
+            return random.sample(BENCHMARK_SAMPLES, count)
 
-        return samples[:min(count, len(samples))]
+        return BENCHMARK_SAMPLES[:count]
 
     def record_sample(self, sample_id: str, duration_hint: float = 30.0) -> Tuple[Optional[np.ndarray], float]:
         """
@@ -316,9 +628,15 @@ class WhisperBenchmark:
             Tuple of (audio_data as numpy array, actual duration in seconds)
         """
         if self.audio_capture is None:
+            try:
+                from .audio_capture import AudioCapture
+            except ImportError:
+                from audio_capture import AudioCapture
+
             self.audio_capture = AudioCapture()
-            if not self.audio_capture.initialize():
+            if not self.audio_capture.is_available():
                 print("ERROR: Failed to initialize audio capture")
+                self.audio_capture = None
                 return None, 0.0
 
         print(f"\n--- Recording Sample: {sample_id} ---")
@@ -329,9 +647,9 @@ class WhisperBenchmark:
         print("Recording... Press ENTER when finished.")
         self.audio_capture.start_recording()
         input()
-        self.audio_capture.stop_recording()
 
-        audio_data = self.audio_capture.get_audio()
+        # stop_recording hands back the capture buffer itself, no extra copy
+        audio_data = self.audio_capture.stop_recording()
         if audio_data is None or len(audio_data) == 0:
             print("ERROR: No audio captured")
             return None, 0.0
@@ -344,20 +662,36 @@ class WhisperBenchmark:
 
     def save_audio_to_file(self, audio_data: np.ndarray, filepath: Path, sample_rate: int = 16000):
         """Save audio data to a WAV file"""
-        # Convert float32 to int16
+        # Convert float32 to int16, scaling into one scratch buffer so the
+        # caller's array (still needed for transcription) is left untouched
         if audio_data.dtype == np.float32:
-            audio_int16 = (audio_data * 32767).astype(np.int16)
+            scaled = np.multiply(audio_data, np.float32(32767.0))
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            np.rint(scaled, out=scaled)
+            audio_int16 = scaled.astype(np.int16)
         else:
-            audio_int16 = audio_data.astype(np.int16)
+            audio_int16 = audio_data.astype(np.int16, copy=False)
 
         with wave.open(str(filepath), 'wb') as wav_file:
             wav_file.setnchannels(1)
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+            wav_file.writeframes(memoryview(np.ascontiguousarray(audio_int16)).cast('B'))
 
     def load_audio_from_file(self, filepath: Path) -> Tuple[Optional[np.ndarray], float]:
         """Load audio data from a WAV file"""
+        if sf is not None:
+            try:
+                # Read int16 and scale by 32767 like the wave path below and
+                # every writer, so a file loads identically either way
+                audio_int16, sample_rate = sf.read(str(filepath), dtype='int16', always_2d=False)
+                if audio_int16.ndim > 1:
+                    audio_int16 = audio_int16[:, 0]
+                audio_float = np.multiply(audio_int16, np.float32(1.0 / 32767.0), dtype=np.float32)
+                return audio_float, len(audio_float) / sample_rate
+            except Exception as e:
+                print(f"WARNING: soundfile could not read {filepath}, trying wave: {e}")
+
         try:
             with wave.open(str(filepath), 'rb') as wav_file:
                 sample_rate = wav_file.getframerate()
@@ -366,7 +700,7 @@ class WhisperBenchmark:
 
                 # Convert to numpy array
                 audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
-                audio_float = audio_int16.astype(np.float32) / 32767.0
+                audio_float = np.multiply(audio_int16, np.float32(1.0 / 32767.0), dtype=np.float32)
 
                 duration = n_frames / sample_rate
                 return audio_float, duration
@@ -396,20 +730,54 @@ class WhisperBenchmark:
         Returns:
             BenchmarkResult or None if failed
         """
-        # Switch to the model
-        if not self.whisper.set_model(model_name):
-            print(f"ERROR: Failed to switch to model: {model_name}")
+        if not self._switch_model(model_name):
             return None
 
-        # Time the transcription
-        start_time = time.perf_counter()
-        transcribed_text = self.whisper.transcribe_audio(audio_data)
-        end_time = time.perf_counter()
+        result = self._time_transcribe(model_name, audio_data, reference_text, sample_id, audio_duration)
+        self._record_columns(result)
+        return result
+
+    def _record_columns(self, result: BenchmarkResult):
+        """Append a result's numeric fields to its model's columns"""
+        _append_result_columns(self._cols[result.model_name], result)
+
+    def _switch_model(self, model_name: str) -> bool:
+        """Load a model once before transcribing all recordings with it"""
+        if not self.whisper.set_model(model_name):
+            print(f"ERROR: Failed to switch to model: {model_name}")
+            return False
+        return True
 
-        inference_time = end_time - start_time
+    def _time_transcribe(
+        self,
+        model_name: str,
+        audio_data: np.ndarray,
+        reference_text: str,
+        sample_id: str,
+        audio_duration: float
+    ) -> BenchmarkResult:
+        """Transcribe one sample with the already-loaded model and score it"""
+        start_ns = time.perf_counter_ns()
+        transcribed_text = self.whisper.transcribe_audio(audio_data, use_cache=False)
+        inference_time = (time.perf_counter_ns() - start_ns) * 1e-9
+
+        return self._make_result(
+            model_name, reference_text, transcribed_text, sample_id,
+            inference_time, audio_duration
+        )
 
-        # Calculate WER
-        wer = calculate_wer(reference_text, transcribed_text)
+    def _make_result(
+        self,
+        model_name: str,
+        reference_text: str,
+        transcribed_text: str,
+        sample_id: str,
+        inference_time: float,
+        audio_duration: float
+    ) -> BenchmarkResult:
+        """Build a BenchmarkResult from a transcription and its timing"""
+        # Calculate WER, keeping the raw counts for corpus-level WER
+        wer, edit_distance, ref_word_count = score_transcription(sample_id, reference_text, transcribed_text)
 
         # Calculate real-time factor
         rtf = inference_time / audio_duration if audio_duration > 0 else float('inf')
@@ -423,16 +791,58 @@ class WhisperBenchmark:
             inference_time_seconds=inference_time,
             audio_duration_seconds=audio_duration,
             real_time_factor=rtf,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            ref_word_count=ref_word_count,
+            edit_distance=edit_distance
         )
 
         return result
 
+    def _run_model_jobs(
+        self,
+        model_name: str,
+        jobs: List[Tuple[np.ndarray, str, str, float]],
+        max_workers: Optional[int] = None
+    ) -> List[BenchmarkResult]:
+        """
+        Transcribe every job with the already-loaded model.
+
+        Jobs run one at a time by default so each inference time measures a
+        single transcription. With more workers the timings include waiting on
+        the serialized in-process model or server, or CPU contention between
+        whisper-cli processes, so only the total wall time is meaningful.
+
+        Args:
+            model_name: Name of the loaded model
+            jobs: (audio_data, reference_text, sample_id, audio_duration) tuples
+            max_workers: Concurrent transcriptions (None = 1)
+
+        Returns:
+            List of BenchmarkResult in job order
+        """
+        if max_workers is None:
+            max_workers = 1
+        elif max_workers > 1:
+            print(f"WARNING: {max_workers} concurrent workers - per-sample times include contention")
+
+        results: List[BenchmarkResult] = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(self._time_transcribe, model_name, *job) for job in jobs]
+            for job, future in zip(jobs, futures):
+                result = future.result()
+                self._record_columns(result)
+                results.append(result)
+                print(f"  - {job[2]}: WER: {result.word_error_rate:.2%}, "
+                      f"Time: {result.inference_time_seconds:.2f}s")
+
+        return results
+
     def run_full_benchmark(
         self,
         models: Optional[List[str]] = None,
         num_samples: int = 10,
-        save_audio: bool = True
+        save_audio: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, ModelSummary]:
         """
         Run a full benchmark session.
@@ -448,6 +858,7 @@ class WhisperBenchmark:
             models: List of model names to test (None = all available)
             num_samples: Number of samples to test
             save_audio: Whether to save recorded audio for future use
+            max_workers: Concurrent transcriptions per model (None = 1)
 
         Returns:
             Dictionary mapping model names to ModelSummary objects
@@ -526,32 +937,25 @@ class WhisperBenchmark:
         print("=" * 60)
 
         all_results: List[BenchmarkResult] = []
+        self._cols.clear()
+        jobs = [
+            (rec['audio_data'], rec['sample']['text'], rec['sample']['id'], rec['duration'])
+            for rec in recordings
+        ]
 
         for model in models:
             print(f"\nTesting model: {model}")
 
-            for rec in recordings:
-                sample = rec['sample']
-                print(f"  - Sample: {sample['id']}...", end=" ", flush=True)
-
-                result = self.benchmark_single(
-                    model_name=model,
-                    audio_data=rec['audio_data'],
-                    reference_text=sample['text'],
-                    sample_id=sample['id'],
-                    audio_duration=rec['duration']
-                )
+            # Load the model once, then run every recording through it
+            if not self._switch_model(model):
+                continue
 
-                if result:
-                    all_results.append(result)
-                    print(f"WER: {result.word_error_rate:.2%}, Time: {result.inference_time_seconds:.2f}s")
-                else:
-                    print("FAILED")
+            all_results.extend(self._run_model_jobs(model, jobs, max_workers))
 
         self.current_results = all_results
 
         # Calculate summaries
-        summaries = self._calculate_summaries(all_results)
+        summaries = self._calculate_summaries()
 
         # Save results
         self._save_results(session_id, all_results, summaries)
@@ -561,49 +965,9 @@ class WhisperBenchmark:
 
         return summaries
 
-    def _calculate_summaries(self, results: List[BenchmarkResult]) -> Dict[str, ModelSummary]:
-        """Calculate summary statistics for each model"""
-        # Group results by model
-        by_model: Dict[str, List[BenchmarkResult]] = {}
-        for r in results:
-            if r.model_name not in by_model:
-                by_model[r.model_name] = []
-            by_model[r.model_name].append(r)
-
-        summaries: Dict[str, ModelSummary] = {}
-
-        for model_name, model_results in by_model.items():
-            wers = [r.word_error_rate for r in model_results]
-            times = [r.inference_time_seconds for r in model_results]
-            rtfs = [r.real_time_factor for r in model_results]
-            durations = [r.audio_duration_seconds for r in model_results]
-
-            avg_wer = np.mean(wers)
-            avg_time = np.mean(times)
-            avg_rtf = np.mean(rtfs)
-            avg_duration = np.mean(durations)
-
-            # Calculate efficiency score using averages
-            efficiency = calculate_efficiency_score(avg_wer, avg_time, avg_duration)
-
-            summaries[model_name] = ModelSummary(
-                model_name=model_name,
-                average_wer=avg_wer,
-                std_wer=np.std(wers) if len(wers) > 1 else 0.0,
-                average_inference_time=avg_time,
-                std_inference_time=np.std(times) if len(times) > 1 else 0.0,
-                average_rtf=avg_rtf,
-                samples_tested=len(model_results),
-                efficiency_score=efficiency,
-                recommendation_rank=0  # Will be set after sorting
-            )
-
-        # Rank by efficiency score
-        ranked = sorted(summaries.values(), key=lambda s: s.efficiency_score, reverse=True)
-        for i, summary in enumerate(ranked, 1):
-            summaries[summary.model_name].recommendation_rank = i
-
-        return summaries
+    def _calculate_summaries(self) -> Dict[str, ModelSummary]:
+        """Calculate summary statistics for each model from the session columns"""
+        return _summarize_columns(self._cols)
 
     def _save_results(
         self,
@@ -612,11 +976,13 @@ class WhisperBenchmark:
         summaries: Dict[str, ModelSummary]
     ):
         """Save benchmark results to JSON"""
+        # orjson serializes dataclasses directly; for json, the flat dataclasses'
+        # __dict__ already holds only primitives, so no recursive asdict copy
         output = {
             'session_id': session_id,
             'timestamp': datetime.now().isoformat(),
-            'results': [asdict(r) for r in results],
-            'summaries': {k: asdict(v) for k, v in summaries.items()},
+            'results': results if orjson else [r.__dict__ for r in results],
+            'summaries': summaries if orjson else {k: v.__dict__ for k, v in summaries.items()},
             'recommendation': None
         }
 
@@ -632,8 +998,14 @@ class WhisperBenchmark:
 
         # Save to file
         output_path = self.results_dir / f"benchmark_{session_id}.json"
-        with open(output_path, 'w') as f:
-            json.dump(output, f, indent=2)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(
+                output,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(output, f, indent=2)
 
         print(f"\nResults saved to: {output_path}")
 
@@ -694,7 +1066,8 @@ class WhisperBenchmark:
         self,
         audio_dir: Path,
         models: Optional[List[str]] = None,
-        reference_texts: Optional[Dict[str, str]] = None
+        reference_texts: Optional[Mapping[str, str]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, ModelSummary]:
         """
         Run benchmark using previously recorded audio files.
@@ -702,7 +1075,8 @@ class WhisperBenchmark:
         Args:
             audio_dir: Directory containing WAV files
             models: List of models to test (None = all available)
-            reference_texts: Dict mapping sample_id to reference text (None = use built-in)
+            reference_texts: Mapping of sample_id to reference text (None = use built-in)
+            max_workers: Concurrent transcriptions per model (None = 1)
 
         Returns:
             Dictionary mapping model names to ModelSummary objects
@@ -718,47 +1092,42 @@ class WhisperBenchmark:
 
         # Build reference text lookup
         if reference_texts is None:
-            reference_texts = {s['id']: s['text'] for s in BENCHMARK_SAMPLES}
+            reference_texts = _REF_TEXT_BY_ID
 
         print(f"\nLoaded {len(audio_files)} audio files")
         print(f"Testing {len(models)} models")
 
-        all_results: List[BenchmarkResult] = []
+        # Load each file once and share it across all models
+        jobs: List[Tuple[np.ndarray, str, str, float]] = []
+        for audio_path in audio_files:
+            sample_id = audio_path.stem
 
-        for model in models:
-            print(f"\nTesting model: {model}")
+            if sample_id not in reference_texts:
+                print(f"  - {sample_id}: No reference text, skipping")
+                continue
 
-            for audio_path in audio_files:
-                sample_id = audio_path.stem
+            audio_data, duration = self.load_audio_from_file(audio_path)
+            if audio_data is None:
+                continue
 
-                if sample_id not in reference_texts:
-                    print(f"  - {sample_id}: No reference text, skipping")
-                    continue
+            jobs.append((audio_data, reference_texts[sample_id], sample_id, duration))
 
-                audio_data, duration = self.load_audio_from_file(audio_path)
-                if audio_data is None:
-                    continue
+        all_results: List[BenchmarkResult] = []
+        self._cols.clear()
 
-                print(f"  - {sample_id}...", end=" ", flush=True)
+        for model in models:
+            print(f"\nTesting model: {model}")
 
-                result = self.benchmark_single(
-                    model_name=model,
-                    audio_data=audio_data,
-                    reference_text=reference_texts[sample_id],
-                    sample_id=sample_id,
-                    audio_duration=duration
-                )
+            # Load the model once, then run every recording through it
+            if not self._switch_model(model):
+                continue
 
-                if result:
-                    all_results.append(result)
-                    print(f"WER: {result.word_error_rate:.2%}, Time: {result.inference_time_seconds:.2f}s")
-                else:
-                    print("FAILED")
+            all_results.extend(self._run_model_jobs(model, jobs, max_workers))
 
         self.current_results = all_results
 
         # Calculate summaries
-        summaries = self._calculate_summaries(all_results)
+        summaries = self._calculate_summaries()
 
         # Save results
         session_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_rerun"
@@ -798,6 +1167,11 @@ def main():
         action='store_true',
         help='Do not save recorded audio files'
     )
+    run_parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Concurrent transcriptions per model; per-sample times include contention (default: 1)'
+    )
 
     # Rerun from saved audio
     rerun_parser = subparsers.add_parser('rerun', help='Rerun benchmark using saved audio')
@@ -811,6 +1185,11 @@ def main():
         nargs='+',
         help='Specific models to test (default: all available)'
     )
+    rerun_parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Concurrent transcriptions per model; per-sample times include contention (default: 1)'
+    )
 
     # List available models
     list_parser = subparsers.add_parser('list', help='List available models')
@@ -845,7 +1224,8 @@ def main():
         benchmark.run_full_benchmark(
             models=args.models,
             num_samples=args.samples,
-            save_audio=not args.no_save_audio
+            save_audio=not args.no_save_audio,
+            max_workers=args.workers
         )
         return
 
@@ -857,7 +1237,8 @@ def main():
 
         benchmark.run_from_saved_audio(
             audio_dir=args.audio_dir,
-            models=args.models
+            models=args.models,
+            max_workers=args.workers
         )
         return
 
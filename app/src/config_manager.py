@@ -3,52 +3,106 @@ Configuration manager for WhisperTux
 Handles loading, saving, and managing application settings
 """
 
+import copy
 import json
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Pattern, Tuple
 import shutil
 
+# Optional fast JSON codec for the config file (falls back to the stdlib)
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Paths and defaults computed once at import rather than per ConfigManager
+_HOME = Path.home()
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_LOCAL_MODELS_DIR = _PROJECT_ROOT / "whisper.cpp" / "models"
+_LOCAL_WHISPER_BINARY = _PROJECT_ROOT / "whisper.cpp" / "build" / "bin" / "whisper-cli"
+_CONFIG_DIR = _HOME / '.config' / 'whispertux'
+_CPU_COUNT = os.cpu_count()
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'primary_shortcut': 'F13',  # Legacy, maps to toggle_shortcut
+    'toggle_shortcut': 'F13',
+    'start_shortcut': '',  # Empty = disabled
+    'stop_shortcut': '',
+    'pause_shortcut': '',
+    'model': 'large-v3',
+    'custom_model_path': None,  # Direct path to a custom .bin model file
+    'model_directories': [      # List of directories to scan for models
+        str(_LOCAL_MODELS_DIR),
+        str(_HOME / "ai" / "models" / "stt" / "whisper-cpp"),
+    ],
+    'key_delay': 15,  # Delay between keystrokes in milliseconds for ydotool
+    'window_position': None,
+    'always_on_top': True,
+    'theme': 'darkly',
+    'audio_device': None,  # None means use system default
+    'word_overrides': {},  # Dictionary of word replacements: {"original": "replacement"}
+    'transcription_threads': max(1, _CPU_COUNT // 2) if _CPU_COUNT else 4,
+    'use_inprocess_backend': False,  # Keep the model loaded via pywhispercpp (opt-in, needs the binding)
+    'use_whisper_server': False,  # Without the in-process backend, keep a local whisper-server running instead
+    'auto_quantize': False,  # Create and use a quantized copy of f32/f16 models on first load
+    'quantize_type': 'q5_0',  # whisper.cpp quantization type for auto_quantize
+    'silence_threshold': 0.01,  # Clips peaking below this (float scale) are not transcribed; 0 disables
+    'whisper_binary': None,  # Optional override for whisper-cli path
+    'operation_mode': 'live_text_entry',  # 'live_text_entry' or 'note_entry'
+}
+
 
 class ConfigManager:
     """Manages application configuration and settings"""
+
+    # Parsed config files shared across instances: {path: (st_mtime_ns, parsed dict)}
+    _parse_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
     
     def __init__(self):
-        # Resolve project paths early for defaults
-        self.project_root = Path(__file__).resolve().parent.parent
-        self.local_models_dir = self.project_root / "whisper.cpp" / "models"
-        self.local_whisper_binary = self.project_root / "whisper.cpp" / "build" / "bin" / "whisper-cli"
-
-        # Default configuration values
-        self.default_config = {
-            'primary_shortcut': 'F13',  # Legacy, maps to toggle_shortcut
-            'toggle_shortcut': 'F13',
-            'start_shortcut': '',  # Empty = disabled
-            'stop_shortcut': '',
-            'pause_shortcut': '',
-            'model': 'large-v3',
-            'custom_model_path': None,  # Direct path to a custom .bin model file
-            'model_directories': [      # List of directories to scan for models
-                str(self.local_models_dir),
-                str(Path.home() / "ai" / "models" / "stt" / "whisper-cpp"),
-            ],
-            'key_delay': 15,  # Delay between keystrokes in milliseconds for ydotool
-            'window_position': None,
-            'always_on_top': True,
-            'theme': 'darkly',
-            'audio_device': None,  # None means use system default
-            'word_overrides': {},  # Dictionary of word replacements: {"original": "replacement"}
-            'transcription_threads': max(1, os.cpu_count() // 2) if os.cpu_count() else 4,
-            'whisper_binary': None,  # Optional override for whisper-cli path
-            'operation_mode': 'live_text_entry',  # 'live_text_entry' or 'note_entry'
-        }
+        # Project paths (resolved once at import)
+        self.project_root = _PROJECT_ROOT
+        self.local_models_dir = _LOCAL_MODELS_DIR
+        self.local_whisper_binary = _LOCAL_WHISPER_BINARY
+
+        # Default configuration values (own copy, so nested lists/dicts aren't shared)
+        self.default_config = copy.deepcopy(_DEFAULT_CONFIG)
         
         # Set up config directory and file path
-        self.config_dir = Path.home() / '.config' / 'whispertux'
-        self.config_file = self.config_dir / 'config.json'
+        self.config_dir = _CONFIG_DIR
+        self.config_file = _CONFIG_DIR / 'config.json'
         
         # Current configuration (starts with defaults)
-        self.config = self.default_config.copy()
+        self.config = copy.deepcopy(_DEFAULT_CONFIG)
+
+        # Set when the in-memory configuration differs from the file on disk
+        self._dirty = False
+
+        # Bumped whenever the word overrides change; the compiled override
+        # pattern is rebuilt on next use when its version falls behind
+        self._overrides_version = 0
+        self._compiled_overrides: Tuple[int, Optional[Pattern], Dict[str, str]] = (-1, None, {})
+
+        # Resolved model files keyed by everything the lookup depends on
+        self._model_path_cache: Dict[tuple, Path] = {}
+
+        # Model directory listings: {directory: (st_mtime_ns, file names)}
+        self._dir_listing_cache: Dict[Path, Tuple[int, frozenset]] = {}
+
+        # whisper binary found by get_whisper_binary_path (None = not resolved yet)
+        self._resolved_binary: Optional[Path] = None
         
         # Ensure config directory exists
         self._ensure_config_dir()
@@ -71,9 +125,18 @@ class ConfigManager:
         """Load configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    
+                mtime_ns = self.config_file.stat().st_mtime_ns
+                cached = self._parse_cache.get(self.config_file)
+
+                # Reuse the parsed file if it hasn't changed since it was last read/written
+                if cached is not None and cached[0] == mtime_ns:
+                    self.config.update(copy.deepcopy(cached[1]))
+                    return
+
+                loaded_config = _loads(self.config_file.read_bytes())
+
+                self._parse_cache[self.config_file] = (mtime_ns, copy.deepcopy(loaded_config))
+
                 # Merge loaded config with defaults (preserving any new default keys)
                 self.config.update(loaded_config)
                 print(f"Configuration loaded from {self.config_file}")
@@ -89,8 +152,19 @@ class ConfigManager:
     def save_config(self) -> bool:
         """Save current configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Serialize once, write a sibling temp file in one go, then atomically
+            # swap it in so a crash can never leave a half-written config
+            data = _dumps(self.config)
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._parse_cache[self.config_file] = (
+                self.config_file.stat().st_mtime_ns, copy.deepcopy(self.config)
+            )
+            self._dirty = False
             print(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -104,6 +178,15 @@ class ConfigManager:
     def set_setting(self, key: str, value: Any):
         """Set a configuration setting"""
         self.config[key] = value
+        self._dirty = True
+        if key == 'word_overrides':
+            self._overrides_version += 1
+        elif key == 'whisper_binary':
+            self._resolved_binary = None
+
+    def is_dirty(self) -> bool:
+        """Check if there are changes that have not been saved yet"""
+        return self._dirty
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all configuration settings"""
@@ -111,7 +194,10 @@ class ConfigManager:
     
     def reset_to_defaults(self):
         """Reset configuration to default values"""
-        self.config = self.default_config.copy()
+        self.config = copy.deepcopy(self.default_config)
+        self._dirty = True
+        self._overrides_version += 1
+        self._resolved_binary = None
         print("Configuration reset to defaults")
     
     def update_shortcuts(self, primary: Optional[str] = None, secondary: Optional[str] = None):
@@ -149,6 +235,7 @@ class ConfigManager:
         if name == 'toggle':
             self.config['primary_shortcut'] = key
 
+        self._dirty = True
         return True
 
     def check_shortcut_conflict(self, name: str, key: str) -> Optional[str]:
@@ -194,6 +281,31 @@ class ConfigManager:
         - Custom model paths (absolute paths to .bin files)
         - Scanning multiple model directories
         """
+        # The key covers every setting the lookup reads, so config changes
+        # naturally miss the cache instead of needing explicit invalidation
+        cache_key = (
+            model_name,
+            self.config.get('model'),
+            self.config.get('custom_model_path'),
+            tuple(self.config.get('model_directories', ())),
+        )
+        # A single stat confirms the file is still there; a deleted model is
+        # resolved again so the lookup can fall through to another directory
+        cached = self._model_path_cache.get(cache_key)
+        if cached is not None:
+            if cached.exists():
+                return cached
+            del self._model_path_cache[cache_key]
+
+        model_path = self._resolve_whisper_model_path(model_name)
+
+        # Only remember files that exist, so a model downloaded later is still found
+        if model_path.exists():
+            self._model_path_cache[cache_key] = model_path
+        return model_path
+
+    def _resolve_whisper_model_path(self, model_name: str) -> Path:
+        """Search the configured locations for a model file"""
         # Check if custom_model_path is set and we're asking for the current model
         custom_path = self.config.get('custom_model_path')
         if custom_path and model_name == self.config.get('model'):
@@ -212,51 +324,66 @@ class ConfigManager:
             str(Path.home() / "ai" / "models" / "stt" / "whisper-cpp")
         ])
 
-        # Search for the model in each directory
+        # Search for the model in each directory, checking candidate names
+        # against one directory listing instead of stat-ing each of them
         for model_dir_str in model_dirs:
             model_dir = Path(model_dir_str).expanduser()
-            if not model_dir.exists():
+            names = self._list_model_dir(model_dir)
+            if names is None:
                 continue
 
             # Special handling for large-v3-turbo with alternate naming conventions
             if model_name == 'large-v3-turbo':
                 turbo_patterns = [
-                    model_dir / "ggml-large-v3-turbo.bin",
-                    model_dir / "ggml-large-v3-turbo.en.bin",
-                    model_dir / "multilang_whisper_large3_turbo.ggml",
-                    model_dir / "whisper_large3_turbo.ggml",
-                    model_dir / "large-v3-turbo.ggml",
-                    model_dir / "ggml-large-v3-turbo.ggml",
+                    "ggml-large-v3-turbo.bin",
+                    "ggml-large-v3-turbo.en.bin",
+                    "multilang_whisper_large3_turbo.ggml",
+                    "whisper_large3_turbo.ggml",
+                    "large-v3-turbo.ggml",
+                    "ggml-large-v3-turbo.ggml",
                 ]
                 for turbo_file in turbo_patterns:
-                    if turbo_file.exists():
-                        return turbo_file
+                    if turbo_file in names:
+                        return model_dir / turbo_file
 
             # Handle different model naming conventions
             if model_name.endswith('.en'):
                 # English-only model
-                model_path = model_dir / f"ggml-{model_name}.bin"
-                if model_path.exists():
-                    return model_path
+                if f"ggml-{model_name}.bin" in names:
+                    return model_dir / f"ggml-{model_name}.bin"
             else:
                 # Check both .en.bin and .bin versions
-                en_model_path = model_dir / f"ggml-{model_name}.en.bin"
-                multi_model_path = model_dir / f"ggml-{model_name}.bin"
-
-                if en_model_path.exists():
-                    return en_model_path
-                elif multi_model_path.exists():
-                    return multi_model_path
+                if f"ggml-{model_name}.en.bin" in names:
+                    return model_dir / f"ggml-{model_name}.en.bin"
+                elif f"ggml-{model_name}.bin" in names:
+                    return model_dir / f"ggml-{model_name}.bin"
 
             # Also check for generic ggml-model.bin (common for finetunes)
-            generic_path = model_dir / "ggml-model.bin"
-            if generic_path.exists() and model_name in str(model_dir):
-                return generic_path
+            if "ggml-model.bin" in names and model_name in str(model_dir):
+                return model_dir / "ggml-model.bin"
 
         # Default fallback: return expected path in first model directory
         default_dir = Path(model_dirs[0]).expanduser() if model_dirs else Path.home() / "ai" / "models" / "stt" / "whisper-cpp"
         return default_dir / f"ggml-{model_name}.en.bin"
 
+    def _list_model_dir(self, model_dir: Path) -> Optional[frozenset]:
+        """Get the file names in a model directory, re-listing only when its mtime changes"""
+        try:
+            mtime_ns = model_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._dir_listing_cache.get(model_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            names = frozenset(os.listdir(model_dir))
+        except OSError:
+            return None
+        self._dir_listing_cache[model_dir] = (mtime_ns, names)
+        return names
+
     def get_model_directories(self) -> list:
         """Get list of model directories"""
         dirs = self.config.get('model_directories', [])
@@ -280,6 +407,7 @@ class ConfigManager:
         if expanded not in dirs:
             dirs.append(expanded)
             self.config['model_directories'] = dirs
+            self._dirty = True
             return True
         return False
 
@@ -290,6 +418,7 @@ class ConfigManager:
         if expanded in dirs:
             dirs.remove(expanded)
             self.config['model_directories'] = dirs
+            self._dirty = True
             return True
         return False
 
@@ -299,10 +428,12 @@ class ConfigManager:
             expanded = Path(path).expanduser()
             if expanded.exists() and expanded.suffix == '.bin':
                 self.config['custom_model_path'] = str(expanded)
+                self._dirty = True
                 return True
             return False
         else:
             self.config['custom_model_path'] = None
+            self._dirty = True
             return True
 
     def get_custom_model_path(self) -> Optional[str]:
@@ -311,6 +442,16 @@ class ConfigManager:
 
     def get_whisper_binary_path(self) -> Path:
         """Get the path to the whisper binary"""
+        if self._resolved_binary is None:
+            binary = self._resolve_whisper_binary()
+            # Keep probing on later calls until the binary actually exists
+            if not binary.exists():
+                return binary
+            self._resolved_binary = binary
+        return self._resolved_binary
+
+    def _resolve_whisper_binary(self) -> Path:
+        """Search the configured override, local build, PATH and common locations for whisper-cli"""
         # 1) Explicit override from config
         override_binary = self.config.get('whisper_binary')
         if override_binary and Path(override_binary).exists():
@@ -350,18 +491,53 @@ class ConfigManager:
     def get_word_overrides(self) -> Dict[str, str]:
         """Get the word overrides dictionary"""
         return self.config.get('word_overrides', {}).copy()
+
+    def get_compiled_word_overrides(self) -> Tuple[Optional[Pattern], Dict[str, str]]:
+        """
+        Get the word overrides as one compiled whole-word pattern plus a lookup map
+
+        Returns:
+            (pattern, map) where map is keyed by the lowercased original word;
+            pattern is None when there are no overrides
+        """
+        version, pattern, override_map = self._compiled_overrides
+        if version == self._overrides_version:
+            return pattern, override_map
+
+        override_map = {}
+        for original, replacement in self.config.get('word_overrides', {}).items():
+            key = original.lower().strip() if original else ''
+            if key and replacement:
+                override_map.setdefault(key, replacement)
+
+        pattern = None
+        if override_map:
+            # Longest first so overlapping overrides prefer the longer phrase
+            pattern = re.compile(
+                r'\b(?:' + '|'.join(re.escape(k) for k in sorted(override_map, key=len, reverse=True)) + r')\b',
+                re.IGNORECASE
+            )
+
+        self._compiled_overrides = (self._overrides_version, pattern, override_map)
+        return pattern, override_map
     
     def add_word_override(self, original: str, replacement: str):
         """Add or update a word override"""
         if 'word_overrides' not in self.config:
             self.config['word_overrides'] = {}
         self.config['word_overrides'][original.lower().strip()] = replacement.strip()
+        self._dirty = True
+        self._overrides_version += 1
     
     def remove_word_override(self, original: str):
         """Remove a word override"""
         if 'word_overrides' in self.config:
             self.config['word_overrides'].pop(original.lower().strip(), None)
+            self._dirty = True
+            self._overrides_version += 1
     
     def clear_word_overrides(self):
         """Clear all word overrides"""
         self.config['word_overrides'] = {}
+        self._dirty = True
+        self._overrides_version += 1
@@ -3,15 +3,159 @@ Text injector for WhisperTux
 Handles injecting transcribed text into other applications using ydotool
 """
 
+import re
+import shutil
 import subprocess
+import threading
 import time
-import pyperclip
 from typing import Optional
 
+# pyperclip is imported on first clipboard use, see _get_pyperclip()
+pyperclip = None
+
+# Optional C automaton for matching all spoken phrases in one linear scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Spoken phrases replaced with punctuation/symbols (case-insensitive, whole words)
+SPOKEN_REPLACEMENTS = {
+    'period': '.',
+    'comma': ',',
+    'question mark': '?',
+    'exclamation mark': '!',
+    'colon': ':',
+    'semicolon': ';',
+    'tux enter': '\n',     # Special phrase for new line
+    'tab': '\t',
+    'dash': '-',
+    'underscore': '_',
+    'open paren': '(',
+    'close paren': ')',
+    'open bracket': '[',
+    'close bracket': ']',
+    'open brace': '{',
+    'close brace': '}',
+    'at symbol': '@',
+    'hash': '#',
+    'dollar sign': '$',
+    'percent': '%',
+    'caret': '^',
+    'ampersand': '&',
+    'asterisk': '*',
+    'plus': '+',
+    'equals': '=',
+    'less than': '<',
+    'greater than': '>',
+    'slash': '/',
+    'backslash': '\\',
+    'pipe': '|',
+    'tilde': '~',
+    'grave': '`',
+    'quote': '"',
+    'apostrophe': "'",
+}
+
+# All spoken phrases fused into one alternation (longest first) so the text is scanned once
+_SPOKEN_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(SPOKEN_REPLACEMENTS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_SPACES_PATTERN = re.compile(r'[ \t]+')
+_NEWLINE_SPACES_PATTERN = re.compile(r' *\n *')
+
+
+def _get_pyperclip():
+    """Import pyperclip the first time the clipboard is needed"""
+    global pyperclip
+    if pyperclip is None:
+        import pyperclip as _pyperclip
+        pyperclip = _pyperclip
+    return pyperclip
+
+
+def _build_spoken_automaton():
+    """Build an Aho-Corasick automaton over the spoken phrases, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase, replacement in SPOKEN_REPLACEMENTS.items():
+        automaton.add_word(phrase, (len(phrase), replacement))
+    automaton.make_automaton()
+    return automaton
+
+
+_SPOKEN_AUTOMATON = _build_spoken_automaton()
+
+
+def _lookup_phrase(mapping: dict, matched: str) -> str:
+    """Replacement for a case-insensitive match, keyed by lowercase phrase"""
+    replacement = mapping.get(matched.lower())
+    if replacement is not None:
+        return replacement
+    # IGNORECASE also accepts Unicode case variants whose lower() is not a
+    # key (e.g. 'ſ' for 's'), so fall back to matching the keys the same way
+    for phrase, replacement in mapping.items():
+        if re.fullmatch(re.escape(phrase), matched, re.IGNORECASE):
+            return replacement
+    return matched
+
+
+def _is_word_char(char: str) -> bool:
+    """Same word-character test the regex word boundaries use"""
+    return char.isalnum() or char == '_'
+
+
+def replace_spoken_phrases(text: str) -> str:
+    """Replace spoken punctuation phrases (whole words, case-insensitive) with their symbols"""
+    lowered = text.lower()
+
+    # Most dictation contains no trigger phrase at all; a few C-level substring
+    # scans rule that out cheaper than either matcher (ASCII only, so case
+    # folding can't make the regex match something lower() doesn't)
+    if text.isascii() and not any(phrase in lowered for phrase in SPOKEN_REPLACEMENTS):
+        return text
+
+    # Fall back to the fused regex without the automaton, or when lowercasing
+    # changed the length and the match offsets would no longer line up
+    if _SPOKEN_AUTOMATON is None or len(lowered) != len(text):
+        return _SPOKEN_PATTERN.sub(lambda m: _lookup_phrase(SPOKEN_REPLACEMENTS, m.group(0)), text)
+
+    spans = []
+    text_len = len(text)
+    for end, (length, replacement) in _SPOKEN_AUTOMATON.iter(lowered):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < text_len and _is_word_char(text[end + 1]):
+            continue
+        spans.append((start, -length, replacement))
+
+    if not spans:
+        return text
+
+    # Leftmost-longest, non-overlapping - the same matches the regex would pick
+    spans.sort()
+    parts = []
+    pos = 0
+    for start, neg_length, replacement in spans:
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = start - neg_length
+    parts.append(text[pos:])
+    return ''.join(parts)
+
 
 class TextInjector:
     """Handles injecting text into focused applications"""
 
+    # Full path to ydotool, resolved once per process (None = not looked up yet)
+    _ydotool_path: Optional[str] = None
+
     def __init__(self, config_manager=None):
         # Configuration
         self.config_manager = config_manager
@@ -29,15 +173,10 @@ class TextInjector:
             print("ydotool not found - text injection will use clipboard fallback")
 
     def _check_ydotool(self) -> bool:
-        """Check if ydotool is available on the atiystem"""
-        try:
-            result = subprocess.run(['which', 'ydotool'],
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-
-
-        except:
-            return False
+        """Check if ydotool is available on the system"""
+        if TextInjector._ydotool_path is None:
+            TextInjector._ydotool_path = shutil.which('ydotool') or ''
+        return bool(TextInjector._ydotool_path)
 
     def inject_text(self, text: str) -> bool:
         """
@@ -85,8 +224,6 @@ class TextInjector:
         """
         Preprocess text to handle common speech-to-text corrections and remove unwanted line breaks
         """
-        import re
-        
         # First, convert unwanted carriage returns and newlines to spaces
         # This prevents accidental "Enter" key presses in applications
         processed = text.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
@@ -94,50 +231,14 @@ class TextInjector:
         # Apply user-defined word overrides first (before built-in corrections)
         processed = self._apply_word_overrides(processed)
         
-        # Handle common speech-to-text corrections
-        replacements = {
-            r'\bperiod\b': '.',
-            r'\bcomma\b': ',',
-            r'\bquestion mark\b': '?',
-            r'\bexclamation mark\b': '!',
-            r'\bcolon\b': ':',
-            r'\bsemicolon\b': ';',
-            r'\btux enter\b': '\n',     # Special phrase for new line
-            r'\btab\b': '\t',
-            r'\bdash\b': '-',
-            r'\bunderscore\b': '_',
-            r'\bopen paren\b': '(',
-            r'\bclose paren\b': ')',
-            r'\bopen bracket\b': '[',
-            r'\bclose bracket\b': ']',
-            r'\bopen brace\b': '{',
-            r'\bclose brace\b': '}',
-            r'\bat symbol\b': '@',
-            r'\bhash\b': '#',
-            r'\bdollar sign\b': '$',
-            r'\bpercent\b': '%',
-            r'\bcaret\b': '^',
-            r'\bampersand\b': '&',
-            r'\basterisk\b': '*',
-            r'\bplus\b': '+',
-            r'\bequals\b': '=',
-            r'\bless than\b': '<',
-            r'\bgreater than\b': '>',
-            r'\bslash\b': '/',
-            r'\bbackslash\b': r'\\',
-            r'\bpipe\b': '|',
-            r'\btilde\b': '~',
-            r'\bgrave\b': '`',
-            r'\bquote\b': '"',
-            r'\bapostrophe\b': "'",
-        }
-
-        for pattern, replacement in replacements.items():
-            processed = re.sub(pattern, replacement, processed, flags=re.IGNORECASE)
+        # Handle common speech-to-text corrections in a single pass
+        processed = replace_spoken_phrases(processed)
 
         # Clean up extra spaces but preserve intentional newlines
-        processed = re.sub(r'[ \t]+', ' ', processed)  # Multiple spaces/tabs to single space
-        processed = re.sub(r' *\n *', '\n', processed)  # Clean spaces around newlines
+        if '\t' in processed or '  ' in processed:
+            processed = _SPACES_PATTERN.sub(' ', processed)  # Multiple spaces/tabs to single space
+        if '\n' in processed:
+            processed = _NEWLINE_SPACES_PATTERN.sub('\n', processed)  # Clean spaces around newlines
         processed = processed.strip()
 
         return processed
@@ -146,33 +247,27 @@ class TextInjector:
         """
         Apply user-defined word overrides to the text
         """
-        import re
-        
         if not self.config_manager:
             return text
-        
-        # Get word overrides from configuration
-        word_overrides = self.config_manager.get_word_overrides()
-        
-        if not word_overrides:
+
+        pattern, override_map = self.config_manager.get_compiled_word_overrides()
+        if pattern is None:
             return text
-        
-        processed = text
-        
-        # Apply each override using word boundary matching for accuracy
-        for original, replacement in word_overrides.items():
-            if original and replacement:
-                # Use word boundaries to match whole words only
-                # This prevents partial word replacements
-                pattern = r'\b' + re.escape(original) + r'\b'
-                processed = re.sub(pattern, replacement, processed, flags=re.IGNORECASE)
-        
-        return processed
+
+        # Overrides are literal words, so a C-level substring check on the
+        # lowercased text rules most transcripts out before the regex runs
+        # (ASCII only, where lower() and IGNORECASE agree)
+        if text.isascii():
+            lowered = text.lower()
+            if not any(original in lowered for original in override_map):
+                return text
+
+        return pattern.sub(lambda m: _lookup_phrase(override_map, m.group(0)), text)
 
     def _copy_to_clipboard(self, text: str) -> bool:
         """Copy text to clipboard as a backup/fallback"""
         try:
-            pyperclip.copy(text)
+            _get_pyperclip().copy(text)
             return True
         except Exception as e:
             print(f"Warning: Failed to copy to clipboard: {e}")
@@ -181,13 +276,15 @@ class TextInjector:
     def _inject_via_ydotool(self, text: str) -> bool:
         """Inject text using ydotool with configurable --key-delay and raw text (no escaping)"""
         try:
-            cmd = ['ydotool', 'type', '--key-delay', str(self.key_delay), text]
-            
-            print(f"Injecting text with ydotool: ydotool type --key-delay {self.key_delay} [text]")
+            # Feed the text through stdin so long dictations can't hit argv size limits
+            cmd = [self._ydotool_path or 'ydotool', 'type', '--key-delay', str(self.key_delay), '--file', '-']
+
+            print(f"Injecting text with ydotool: ydotool type --key-delay {self.key_delay} --file - [stdin]")
 
             # Run the command
             result = subprocess.run(
                 cmd,
+                input=text,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -211,12 +308,12 @@ class TextInjector:
         try:
             # Save current clipboard content
             try:
-                original_clipboard = pyperclip.paste()
+                original_clipboard = _get_pyperclip().paste()
             except:
                 original_clipboard = ""
 
             # Set new clipboard content
-            pyperclip.copy(text)
+            _get_pyperclip().copy(text)
 
             # Small delay to ensure clipboard is set
             time.sleep(0.1)
@@ -225,7 +322,7 @@ class TextInjector:
             if self.ydotool_available:
                 # Use ydotool to send Ctrl+V
                 result = subprocess.run(
-                    ['ydotool', 'key', '29:1', '47:1', '47:0', '29:0'],
+                    [self._ydotool_path or 'ydotool', 'key', '29:1', '47:1', '47:0', '29:0'],
                     capture_output=True,
                     timeout=5
                 )
@@ -245,7 +342,6 @@ class TextInjector:
                     pass  # Ignore restore errors
 
             # Run restore in a separate thread so it doesn't block
-            import threading
             restore_thread = threading.Thread(target=restore_clipboard, daemon=True)
             restore_thread.start()
 
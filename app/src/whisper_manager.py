@@ -3,18 +3,76 @@ Whisper manager for WhisperTux
 Handles interaction with whisper.cpp for audio transcription
 """
 
+import atexit
 import subprocess
 import tempfile
 import os
-import wave
+import io
+import re
+import hashlib
+import socket
+import struct
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import numpy as np
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 try:
     from .config_manager import ConfigManager
 except ImportError:
     from config_manager import ConfigManager
 
+# Optional in-process whisper.cpp binding; keeps the model loaded between
+# transcriptions instead of starting whisper-cli for every utterance
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+except ImportError:
+    WhisperCppModel = None
+
+# Standalone .bin files starting with these are stock models, not finetunes
+_STANDARD_MODEL_PREFIXES = ('ggml-tiny', 'ggml-base', 'ggml-small', 'ggml-medium', 'ggml-large')
+
+# Lowercased file stems that look like finetunes ("ggml", "finetune", "fine-tune", "fine_tune")
+_FINETUNE_STEM = re.compile(r'ggml|fine[-_]?tune')
+
+# whisper-cli timeout: a fixed allowance for process start and model load,
+# plus time proportional to the audio so long dictations aren't cut off
+_TIMEOUT_BASE_S = 30.0
+_TIMEOUT_PER_AUDIO_S = 2.0
+
+# GGML whisper model file header: magic followed by 11 int32 hparams, the
+# last being ftype (0 = f32, 1 = f16, others quantized; the quantization
+# version is folded in as ftype + 1000 * version)
+_GGML_HEADER = struct.Struct('<I11i')
+_GGML_MAGIC = 0x67676d6c
+
+# RIFF/WAVE header for mono 16-bit PCM, packed in one call per file
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Stock model sizes, in listing order
+_STOCK_MODELS = ('tiny', 'base', 'small', 'medium', 'large', 'large-v2', 'large-v3', 'large-v3-turbo')
+
+# Per stock model: candidate file names with their internal names, English-only first
+_STOCK_MODEL_FILES = tuple(
+    (model, ((f"ggml-{model}.en.bin", f"{model}.en"), (f"ggml-{model}.bin", model)))
+    for model in _STOCK_MODELS
+)
+
+# large-v3-turbo file names, including alternate conventions (used by dsnote, etc.)
+_TURBO_FILENAMES = (
+    "ggml-large-v3-turbo.bin",
+    "ggml-large-v3-turbo.en.bin",
+    "multilang_whisper_large3_turbo.ggml",
+    "whisper_large3_turbo.ggml",
+    "large-v3-turbo.ggml",
+    "ggml-large-v3-turbo.ggml",
+)
+
 
 class WhisperManager:
     """Manages whisper.cpp integration for audio transcription"""
@@ -34,6 +92,53 @@ class WhisperManager:
         # Whisper process state
         self.current_process = None
         self.ready = False
+
+        # In-process backend (None = run whisper-cli per transcription).
+        # A whisper.cpp context is not safe to share between concurrent calls.
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._switch_lock = threading.Lock()  # One set_model() at a time (GUI and benchmark)
+
+        # Recently used in-process models keyed by (path, threads), so toggling
+        # between two models doesn't reload either from disk
+        self._model_cache = OrderedDict()
+        self._model_cache_size = 2
+
+        # Optional local whisper-server process (see _start_server); None when
+        # not running, in which case whisper-cli is started per transcription
+        self._server_proc = None
+        self._server_url = None
+        self._server_lock = threading.Lock()
+        atexit.register(self._stop_server)
+
+        # Whether whisper-cli accepts WAV data on stdin ("-f -"); None until a
+        # transcription confirms it, False routes transcriptions through a memfd or temp file
+        self._stdin_supported = None
+
+        # String forms of whisper_binary / model_path for the whisper-cli
+        # command line, refreshed whenever either path changes
+        self._whisper_binary_str = None
+        self._model_path_str = None
+
+        # Trailing whisper-cli options, rebuilt only when the thread count changes
+        self._cmd_options = []
+        self._cmd_options_threads = None
+
+        # get_available_models() result, reused while the model directories
+        # are unchanged (see _model_scan_signature)
+        self._scan_cache = None
+        self._scan_sig = None
+        self._scan_lock = threading.Lock()  # One scan at a time; later callers hit the cache
+
+        # Display name -> model file path, filled by get_available_models()
+        self._model_paths = {}
+        self._internal_to_display = {}
+
+        # Recent transcriptions keyed by (audio digest, model, sample rate),
+        # so a re-sent identical clip skips whisper entirely
+        self._result_cache = OrderedDict()
+        self._result_cache_size = 64
+        self._result_cache_lock = threading.Lock()
         
     def initialize(self) -> bool:
         """Initialize the whisper manager and check dependencies"""
@@ -42,33 +147,44 @@ class WhisperManager:
             self.whisper_binary = self.config.get_whisper_binary_path()
             self.temp_dir = self.config.get_temp_directory()
 
-            # Check if whisper binary exists
-            if not self.whisper_binary.exists():
-                print(f"ERROR: Whisper binary not found at: {self.whisper_binary}")
-                print("  Please build whisper.cpp first by running the build scripts")
-                return False
-
-            # Scan for available models to populate the cache
-            self.get_available_models()
-
             # Migrate old model name format to new display name format
             self._migrate_model_name()
 
-            # Set model path based on current model - check cached paths first
-            self.model_path = self.get_model_path(self.current_model)
-
-            if self.model_path is None or not self.model_path.exists():
-                # Try config manager as fallback with internal name conversion
-                internal_name = self._get_internal_name(self.current_model)
-                self.model_path = self.config.get_whisper_model_path(internal_name)
+            # Resolve the current model through the config first; the full
+            # directory scan is only needed up front if that fails
+            self.model_path, found = self._find_model_file(self.current_model)
+            if found:
+                # Populate the model list cache in the background for the UI
+                threading.Thread(target=self.get_available_models, daemon=True).start()
+            else:
+                self.get_available_models()
+                self.model_path, found = self._find_model_file(self.current_model)
 
             # Check if model exists
-            if self.model_path is None or not self.model_path.exists():
+            if not found:
                 print(f"ERROR: Whisper model not found at: {self.model_path}")
                 print(f"  Please download the {self.current_model} model first")
                 return False
 
-            print(f"Whisper binary found: {self.whisper_binary}")
+            # Swap in a quantized copy of a full-precision model if enabled
+            self.model_path = self._maybe_quantize(self.model_path)
+
+            self._update_command_strings()
+
+            # Keep the model loaded in-process when enabled and the binding is installed,
+            # otherwise in a whisper-server process if that is enabled
+            self._load_backend_model()
+            if self._model is None:
+                self._start_server()
+
+            # The whisper-cli binary is only needed without the in-process backend
+            if self._model is None:
+                if not self.whisper_binary.exists():
+                    print(f"ERROR: Whisper binary not found at: {self.whisper_binary}")
+                    print("  Please build whisper.cpp first by running the build scripts")
+                    return False
+                print(f"Whisper binary found: {self.whisper_binary}")
+
             print(f"Using model: {self.current_model} at {self.model_path}")
 
             self.ready = True
@@ -78,6 +194,239 @@ class WhisperManager:
             print(f"ERROR: Failed to initialize Whisper manager: {e}")
             return False
 
+    def _load_backend_model(self):
+        """Load the current model into the in-process whisper.cpp backend, if available
+
+        The previous model keeps serving transcriptions until the new one is
+        ready, then the two are swapped under the model lock.
+        """
+        if (WhisperCppModel is None or self.model_path is None
+                or not self.config.get_setting('use_inprocess_backend', False)):
+            self._model_cache.clear()
+            self._swap_model(None)
+            return
+
+        threads = self.config.get_setting('transcription_threads', 4)
+        cache_key = (str(self.model_path), threads)
+        model = self._model_cache.get(cache_key)
+        if model is not None:
+            self._model_cache.move_to_end(cache_key)
+            self._swap_model(model)
+            print(f"Reusing loaded model: {self.model_path}")
+            return
+
+        # Make room first so no more than the cache size is ever resident
+        while len(self._model_cache) >= self._model_cache_size:
+            self._model_cache.popitem(last=False)
+
+        try:
+            model = WhisperCppModel(
+                str(self.model_path),
+                n_threads=threads,
+                language='en',
+                print_progress=False,
+                print_realtime=False
+            )
+        except Exception as e:
+            print(f"WARNING: Could not load model in-process, using whisper-cli: {e}")
+            self._swap_model(None)
+            return
+
+        self._model_cache[cache_key] = model
+        self._swap_model(model)
+        print(f"Loaded model in-process: {self.model_path}")
+
+    def _swap_model(self, model):
+        """Install a new in-process model (or None), waiting out any transcription using the old one"""
+        with self._model_lock:
+            self._model = model
+
+    def _start_server(self):
+        """
+        Start (or restart) a local whisper-server with the current model
+
+        whisper.cpp builds whisper-server next to whisper-cli. Keeping one
+        running amortizes the model load across utterances when the
+        pywhispercpp binding is not installed. Opt-in via 'use_whisper_server'.
+        """
+        self._stop_server()
+
+        if not self.config.get_setting('use_whisper_server', False):
+            return
+
+        server_binary = self.whisper_binary.with_name('whisper-server')
+        if not server_binary.exists():
+            print(f"WARNING: whisper-server not found at {server_binary}, using whisper-cli")
+            return
+
+        # Let the OS pick a free loopback port
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        threads = self.config.get_setting('transcription_threads', 4)
+        cmd = [
+            str(server_binary),
+            '-m', str(self.model_path),
+            '--host', '127.0.0.1',
+            '--port', str(port),
+            '--language', 'en',
+            '--threads', str(threads)
+        ]
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"WARNING: Could not start whisper-server, using whisper-cli: {e}")
+            return
+
+        # Wait for the model to load and the server to answer
+        url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + 120
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                print(f"WARNING: whisper-server exited with code {proc.returncode}, using whisper-cli")
+                return
+            try:
+                with urllib.request.urlopen(url + '/', timeout=1):
+                    break
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.2)
+        else:
+            print("WARNING: whisper-server did not become ready, using whisper-cli")
+            proc.kill()
+            proc.wait()
+            return
+
+        with self._server_lock:
+            self._server_proc = proc
+            self._server_url = url
+        print(f"whisper-server running at {url} with {self.model_path}")
+
+    def _stop_server(self):
+        """Shut down the whisper-server process, if one is running"""
+        with self._server_lock:
+            proc = self._server_proc
+            self._server_proc = None
+            self._server_url = None
+
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def _run_whisper_server(self, wav_bytes: bytes, timeout: float) -> Optional[str]:
+        """
+        Transcribe WAV data with the running whisper-server
+
+        Args:
+            wav_bytes: Complete WAV file contents
+            timeout: Seconds before the request is abandoned
+
+        Returns:
+            Transcribed text, or None if the server is unusable and the caller
+            should fall back to whisper-cli
+        """
+        url = self._server_url
+        if url is None:
+            return None
+
+        boundary = uuid.uuid4().hex
+        body = b''.join([
+            f'--{boundary}\r\n'.encode(),
+            b'Content-Disposition: form-data; name="file"; filename="audio.wav"\r\n',
+            b'Content-Type: audio/wav\r\n\r\n',
+            wav_bytes,
+            f'\r\n--{boundary}\r\n'.encode(),
+            b'Content-Disposition: form-data; name="response_format"\r\n\r\n',
+            b'text',
+            f'\r\n--{boundary}--\r\n'.encode(),
+        ])
+        request = urllib.request.Request(
+            url + '/inference',
+            data=body,
+            headers={'Content-Type': f'multipart/form-data; boundary={boundary}'}
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.read().decode('utf-8', errors='replace').strip()
+        except (urllib.error.URLError, OSError) as e:
+            print(f"whisper-server request failed, falling back to whisper-cli: {e}")
+            self._stop_server()
+            return None
+
+    def _is_full_precision(self, model_path: Path) -> bool:
+        """Check a GGML model header for an unquantized (f32/f16) model"""
+        try:
+            with open(model_path, 'rb') as f:
+                header = f.read(_GGML_HEADER.size)
+        except OSError:
+            return False
+        if len(header) < _GGML_HEADER.size:
+            return False
+        magic, *hparams = _GGML_HEADER.unpack(header)
+        return magic == _GGML_MAGIC and hparams[-1] % 1000 in (0, 1)
+
+    def _maybe_quantize(self, model_path: Path, create: bool = True) -> Path:
+        """
+        Return a quantized copy of the model when 'auto_quantize' is enabled
+
+        Quantized weights move a fraction of the bytes per inference step,
+        which is what bounds whisper.cpp on CPU. The copy is written next to
+        the original as <stem>-<type>.bin using whisper.cpp's quantize tool.
+
+        Args:
+            model_path: Model file to use
+            create: Run the quantize tool if no copy exists yet
+
+        Returns:
+            Path of the quantized copy, or model_path unchanged
+        """
+        if not self.config.get_setting('auto_quantize', False):
+            return model_path
+
+        qtype = self.config.get_setting('quantize_type', 'q5_0')
+        target = model_path.with_name(f"{model_path.stem}-{qtype}.bin")
+        if target.exists():
+            return target
+        if not create or not self._is_full_precision(model_path):
+            return model_path
+
+        tool = next((self.whisper_binary.with_name(name)
+                     for name in ('whisper-quantize', 'quantize')
+                     if self.whisper_binary.with_name(name).exists()), None)
+        if tool is None:
+            print(f"WARNING: whisper.cpp quantize tool not found next to {self.whisper_binary}")
+            return model_path
+
+        print(f"Quantizing {model_path.name} to {qtype}, this only happens once...")
+        try:
+            result = subprocess.run(
+                [str(tool), str(model_path), str(target), qtype],
+                capture_output=True,
+                timeout=1800
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            print(f"WARNING: Model quantization failed: {e}")
+            result = None
+
+        if result is not None and result.returncode == 0 and target.exists():
+            print(f"Using quantized model: {target}")
+            return target
+
+        if result is not None and result.returncode != 0:
+            print(f"WARNING: Model quantization failed with return code {result.returncode}")
+            print(f"stderr: {result.stderr.decode('utf-8', errors='replace')}")
+        try:
+            target.unlink()  # Don't leave a partial file to be picked up next time
+        except OSError:
+            pass
+        return model_path
+
     def _migrate_model_name(self):
         """Migrate old model name format to new display name format"""
         old_name = self.current_model
@@ -110,13 +459,15 @@ class WhisperManager:
         """Check if whisper is ready for transcription"""
         return self.ready
     
-    def transcribe_audio(self, audio_data: np.ndarray, sample_rate: int = 16000) -> str:
+    def transcribe_audio(self, audio_data: np.ndarray, sample_rate: int = 16000,
+                         use_cache: bool = True) -> str:
         """
         Transcribe audio data using whisper.cpp
         
         Args:
             audio_data: NumPy array of audio samples (float32)
             sample_rate: Sample rate of the audio data
+            use_cache: Reuse the result of an identical recent clip (disable for timing)
             
         Returns:
             Transcribed text string
@@ -138,63 +489,161 @@ class WhisperManager:
         if len(audio_data) < min_samples:
             print(f"Audio too short: {len(audio_data)} samples (minimum {min_samples})")
             return ""
-        
-        # Create temporary WAV file
+
+        # Skip clips that never rise above the noise floor (accidental
+        # push-to-talk presses); whisper tends to hallucinate text on these
+        silence_threshold = self.config.get_setting('silence_threshold', 0.01)
+        if silence_threshold and np.issubdtype(audio_data.dtype, np.floating):
+            peak = max(float(audio_data.max()), -float(audio_data.min()))
+            if peak < silence_threshold:
+                print(f"Audio is silent (peak {peak:.4f} below {silence_threshold}), skipping transcription")
+                return ""
+
+        # Hashing is cheap next to inference, but skip it for long clips,
+        # which are unlikely to repeat exactly
+        cache_key = None
+        if use_cache and len(audio_data) <= 30 * sample_rate:
+            audio_bytes = np.ascontiguousarray(audio_data).data
+            digest = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+            cache_key = (digest, audio_data.dtype.str, str(self.model_path), sample_rate)
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    return cached
+
+        transcription = self._transcribe(audio_data, sample_rate)
+
+        # Failures also come back empty, so only real text is remembered
+        if cache_key is not None and transcription:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = transcription
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+
+        return transcription
+
+    def _transcribe(self, audio_data: np.ndarray, sample_rate: int) -> str:
+        """Transcribe validated audio with whichever backend is active"""
+        # The in-process backend takes 16 kHz float samples directly, so the
+        # int16 WAV encode, temp file and decode are skipped entirely
+        model = self._model
+        if (model is not None and sample_rate == 16000
+                and np.issubdtype(audio_data.dtype, np.floating)):
+            samples = np.ascontiguousarray(audio_data, dtype=np.float32)
+            return self._run_in_process(model, samples).strip()
+
+        timeout = self._whisper_timeout(len(audio_data) / sample_rate)
+
+        # A running whisper-server already has the model loaded
+        if self._server_url is not None:
+            wav_buffer = io.BytesIO()
+            self._save_audio_as_wav(audio_data, wav_buffer, sample_rate)
+            transcription = self._run_whisper_server(wav_buffer.getvalue(), timeout)
+            if transcription is not None:
+                return transcription.strip()
+
+        # Encode the WAV in memory and pipe it to whisper-cli, avoiding the
+        # temp file write, read back and unlink
+        wav_buffer = io.BytesIO()
+        self._save_audio_as_wav(audio_data, wav_buffer, sample_rate)
+
+        stdin_tried = self._stdin_supported is not False
+        if stdin_tried:
+            transcription = self._run_whisper_stdin(wav_buffer.getbuffer(), timeout)
+            if transcription is not None:
+                return transcription.strip()
+
+        transcription = self._run_whisper_file(wav_buffer.getbuffer(), timeout)
+
+        # Builds that cannot read "-" still exit 0, just with no text; a file
+        # giving text for the same clip settles it
+        if stdin_tried and transcription and self._stdin_supported is None:
+            print("whisper-cli cannot read audio from stdin, falling back to file input")
+            self._stdin_supported = False
+
+        return transcription
+
+    def _run_whisper_file(self, wav_bytes, timeout: float) -> str:
+        """Run whisper.cpp on WAV data written to a file: a RAM-backed memfd on Linux, else a temp file"""
+        if hasattr(os, 'memfd_create'):
+            return self._run_whisper_memfd(wav_bytes, timeout).strip()
+
         with tempfile.NamedTemporaryFile(suffix='.wav', delete=False, dir=self.temp_dir) as temp_file:
+            temp_file.write(wav_bytes)
             temp_wav_path = temp_file.name
-            
+
         try:
-            # Save audio data as WAV file
-            self._save_audio_as_wav(audio_data, temp_wav_path, sample_rate)
-            
             # Run whisper.cpp transcription
-            transcription = self._run_whisper(temp_wav_path)
-            
+            transcription = self._run_whisper(temp_wav_path, timeout)
+
             return transcription.strip() if transcription else ""
-            
+
         finally:
             # Clean up temporary file
             try:
                 os.unlink(temp_wav_path)
-            except:
+            except OSError:
                 pass  # Ignore cleanup errors
     
-    def _save_audio_as_wav(self, audio_data: np.ndarray, filepath: str, sample_rate: int):
-        """Save numpy audio data as a WAV file"""
+    def _save_audio_as_wav(self, audio_data: np.ndarray, filepath, sample_rate: int):
+        """Save numpy audio data as a WAV file (path or writable binary file object)"""
         # Convert float32 to int16 for WAV format
         if audio_data.dtype == np.float32:
-            # Scale from [-1, 1] to [-32768, 32767]
-            audio_int16 = (audio_data * 32767).astype(np.int16)
+            # Scale from [-1, 1] to [-32768, 32767] in one scratch buffer,
+            # clamping so overshoot like 1.0000001 saturates instead of wrapping
+            scaled = np.multiply(audio_data, np.float32(32767.0))
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            np.rint(scaled, out=scaled)
+            audio_int16 = scaled.astype(np.int16)
         else:
-            audio_int16 = audio_data.astype(np.int16)
-        
-        with wave.open(filepath, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+            audio_int16 = audio_data.astype(np.int16, copy=False)
+
+        # WAV samples are little-endian (a no-op cast on x86/ARM)
+        samples = memoryview(np.ascontiguousarray(audio_int16, dtype='<i2')).cast('B')
+        header = _WAV_HEADER.pack(
+            b'RIFF', 36 + samples.nbytes, b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,  # PCM, mono, 16-bit
+            b'data', samples.nbytes
+        )
+
+        if hasattr(filepath, 'write'):
+            filepath.write(header)
+            filepath.write(samples)
+            return
+
+        # Header and samples go out in a single writev; loop only on a short write
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            written = os.writev(fd, [header, samples])
+            total = len(header) + samples.nbytes
+            while written < total:
+                if written < len(header):
+                    written += os.write(fd, header[written:])
+                else:
+                    written += os.write(fd, samples[written - len(header):])
+        finally:
+            os.close(fd)
     
-    def _run_whisper(self, audio_file_path: str) -> str:
+    def _whisper_timeout(self, audio_seconds: float) -> float:
+        """Seconds to allow a whisper-cli run on this much audio"""
+        return _TIMEOUT_BASE_S + _TIMEOUT_PER_AUDIO_S * audio_seconds
+
+    def _run_whisper(self, audio_file_path: str, timeout: float = _TIMEOUT_BASE_S) -> str:
         """Run whisper.cpp on the given audio file"""
+        model = self._model
+        if model is not None:
+            return self._run_in_process(model, audio_file_path)
+
         try:
-            threads = self.config.get_setting('transcription_threads', 4)
-            # Construct whisper.cpp command
-            cmd = [
-                str(self.whisper_binary),
-                '-m', str(self.model_path),
-                '-f', audio_file_path,
-                '--output-txt',
-                '--no-timestamps',
-                '--language', 'en',
-                '--threads', str(threads)
-            ]
-            
+            cmd = self._build_whisper_command([audio_file_path])
+
             # Run the command
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                timeout=30  # 30 second timeout
+                timeout=timeout
             )
             
             if result.returncode == 0:
@@ -208,10 +657,10 @@ class WhisperManager:
                     return transcription
                 else:
                     # Fall back to stdout if no txt file
-                    return result.stdout.strip()
+                    return result.stdout.decode('utf-8', errors='replace').strip()
             else:
                 print(f"Whisper command failed with return code {result.returncode}")
-                print(f"stderr: {result.stderr}")
+                print(f"stderr: {result.stderr.decode('utf-8', errors='replace')}")
                 return ""
                 
         except subprocess.TimeoutExpired:
@@ -221,48 +670,215 @@ class WhisperManager:
             print(f"Error running whisper: {e}")
             return ""
     
-    def set_model(self, model_name: str) -> bool:
+    def _run_whisper_stdin(self, wav_bytes, timeout: float = _TIMEOUT_BASE_S) -> Optional[str]:
         """
-        Change the whisper model
+        Run whisper.cpp on in-memory WAV data passed through stdin
 
         Args:
-            model_name: Display name of the model (e.g., 'base stock', 'small stock', 'daniel-fine-tune-base - fine tune')
+            wav_bytes: Complete WAV file contents
+            timeout: Seconds before the run is abandoned
 
         Returns:
-            True if successful, False otherwise
+            Transcribed text, or None if the caller should retry through a
+            file: the build cannot read stdin, or it has not yet been seen
+            to (an unsupported build exits 0 with empty output)
         """
         try:
-            # Check if the new model exists using cached paths first
-            new_model_path = self.get_model_path(model_name)
+            result = subprocess.run(
+                self._build_whisper_command(['-'], output_txt=False),
+                input=wav_bytes,
+                capture_output=True,
+                timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            print("Whisper transcription timed out")
+            return ""
+        except Exception as e:
+            print(f"Error running whisper: {e}")
+            return ""
 
-            if new_model_path is None or not new_model_path.exists():
-                # Try config manager as fallback with internal name conversion
-                internal_name = self._get_internal_name(model_name)
-                new_model_path = self.config.get_whisper_model_path(internal_name)
+        if result.returncode == 0:
+            transcription = result.stdout.decode('utf-8', errors='replace').strip()
+            if transcription:
+                self._stdin_supported = True
+            elif not self._stdin_supported:
+                return None
+            return transcription
 
-            if new_model_path is None or not new_model_path.exists():
-                print(f"ERROR: Model {model_name} not found at {new_model_path}")
-                return False
+        if self._stdin_supported is None:
+            # Older builds treat "-" as a file name; use file input from now on
+            print("whisper-cli cannot read audio from stdin, falling back to file input")
+            self._stdin_supported = False
+            return None
 
-            # Update current model
-            self.current_model = model_name
-            self.model_path = new_model_path
+        print(f"Whisper command failed with return code {result.returncode}")
+        print(f"stderr: {result.stderr.decode('utf-8', errors='replace')}")
+        return ""
 
-            # Update config - store model name and custom path if it's a finetune/custom
-            self.config.set_setting('model', model_name)
+    def _run_whisper_memfd(self, wav_bytes, timeout: float = _TIMEOUT_BASE_S) -> str:
+        """
+        Run whisper.cpp on WAV data held in an anonymous in-memory file (Linux)
 
-            # If it's a finetune or custom model, also store the full path
-            if model_name.endswith(' - fine tune') or model_name.startswith('[Custom]'):
-                self.config.set_custom_model_path(str(new_model_path))
-            else:
-                self.config.set_custom_model_path(None)
+        The memfd is inherited by whisper-cli and opened through
+        /proc/self/fd, so nothing touches the temp directory on disk.
 
-            print(f"Switched to model: {model_name} at {new_model_path}")
-            return True
+        Args:
+            wav_bytes: Complete WAV file contents
+            timeout: Seconds before the run is abandoned
 
+        Returns:
+            Transcribed text, or an empty string on failure
+        """
+        try:
+            fd = os.memfd_create('whispertux-wav')
+        except OSError as e:
+            print(f"Error creating in-memory audio file: {e}")
+            return ""
+
+        try:
+            view = memoryview(wav_bytes)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+
+            result = subprocess.run(
+                self._build_whisper_command([f'/proc/self/fd/{fd}'], output_txt=False),
+                pass_fds=(fd,),
+                capture_output=True,
+                timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            print("Whisper transcription timed out")
+            return ""
+        except Exception as e:
+            print(f"Error running whisper: {e}")
+            return ""
+        finally:
+            os.close(fd)
+
+        if result.returncode == 0:
+            return result.stdout.decode('utf-8', errors='replace').strip()
+
+        print(f"Whisper command failed with return code {result.returncode}")
+        print(f"stderr: {result.stderr.decode('utf-8', errors='replace')}")
+        return ""
+
+    def _update_command_strings(self):
+        """Cache the string forms of the binary and model paths used on every whisper-cli call"""
+        self._whisper_binary_str = str(self.whisper_binary)
+        self._model_path_str = str(self.model_path)
+
+    def _build_whisper_command(self, audio_file_paths: List[str], output_txt: bool = True) -> List[str]:
+        """Construct the whisper-cli command line for one or more input files"""
+        # Threads are read per call so a change in settings applies immediately
+        threads = self.config.get_setting('transcription_threads', 4)
+        if threads != self._cmd_options_threads:
+            self._cmd_options = [
+                '--no-timestamps',
+                '--language', 'en',
+                '--threads', str(threads)
+            ]
+            self._cmd_options_threads = threads
+
+        cmd = [self._whisper_binary_str, '-m', self._model_path_str]
+        for path in audio_file_paths:
+            cmd.extend(['-f', path])
+        if output_txt:
+            cmd.append('--output-txt')
+        cmd.extend(self._cmd_options)
+        return cmd
+
+    def _run_in_process(self, model, media) -> str:
+        """Transcribe with an in-process model
+
+        Args:
+            model: The loaded model, read once by the caller so a concurrent
+                set_model() cannot swap it out from under this call
+            media: Path to an audio file, or 16 kHz mono float32 samples
+
+        Returns:
+            Transcribed text, or an empty string on failure
+        """
+        try:
+            with self._model_lock:
+                segments = model.transcribe(media)
+            return ' '.join(segment.text.strip() for segment in segments)
+        except Exception as e:
+            print(f"Error running in-process whisper: {e}")
+            return ""
+
+    def set_model(self, model_name: str, update_config: bool = True) -> bool:
+        """
+        Change the whisper model
+
+        Loading the new model can take seconds (or minutes with
+        whisper-server), so GUI callers should run this off the GUI thread,
+        pass update_config=False and call store_model_setting() themselves
+        once it returns, keeping config changes on the GUI thread.
+
+        Args:
+            model_name: Display name of the model (e.g., 'base stock', 'small stock', 'daniel-fine-tune-base - fine tune')
+            update_config: Record the model (and custom path) in the config
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self._switch_lock:
+                if not self._set_model(model_name):
+                    return False
+            if update_config:
+                self.store_model_setting(model_name)
+            return True
         except Exception as e:
             print(f"ERROR: Failed to set model {model_name}: {e}")
             return False
+
+    def _set_model(self, model_name: str) -> bool:
+        """Body of set_model(), run with the switch lock held"""
+        # Check if the new model exists
+        new_model_path, found = self._find_model_file(model_name)
+
+        if not found:
+            print(f"ERROR: Model {model_name} not found at {new_model_path}")
+            return False
+
+        # Use an existing quantized copy; creating one is left to initialize()
+        model_path = self._maybe_quantize(new_model_path, create=False)
+
+        # Swap the loaded model only if the file actually changed; before
+        # initialize() it is loaded there
+        reload = self.ready and model_path != self.model_path
+
+        # Update current model
+        self.current_model = model_name
+        self.model_path = model_path
+        self._update_command_strings()
+
+        if reload:
+            self._load_backend_model()
+            if self._model is None:
+                self._start_server()
+
+        print(f"Switched to model: {model_name} at {new_model_path}")
+        return True
+
+    def store_model_setting(self, model_name: str):
+        """
+        Record a model chosen with set_model() in the config (not saved to disk)
+
+        Args:
+            model_name: Display name of the model
+        """
+        # Update config - store model name and custom path if it's a finetune/custom
+        self.config.set_setting('model', model_name)
+
+        # If it's a finetune or custom model, also store the full path
+        if model_name.endswith(' - fine tune') or model_name.startswith('[Custom]'):
+            model_path, _ = self._find_model_file(model_name)
+            self.config.set_custom_model_path(str(model_path))
+        else:
+            self.config.set_custom_model_path(None)
     
     def get_current_model(self) -> str:
         """Get the current model name"""
@@ -299,75 +915,102 @@ class WhisperManager:
 
         return display_name
 
-    def get_available_models(self) -> list:
-        """Get list of available whisper models from all configured directories"""
-        available_models = []
-        model_paths = {}  # Track paths for display
-        internal_to_display = {}  # Map internal names to display names
+    def _model_scan_signature(self, model_dirs: list) -> tuple:
+        """Cheap fingerprint of the model directories for the scan cache
+
+        Records the mtime of each configured directory and of its immediate
+        subdirectories, so adding or removing a model file at the top level
+        or inside a finetune folder invalidates the cached scan. Changes
+        further down are not seen; model lists shown to the user pass
+        refresh=True to get_available_models().
+        """
+        sig = []
+        for model_dir_str in model_dirs:
+            model_dir = os.path.expanduser(model_dir_str)
+            try:
+                entries = [(model_dir, os.stat(model_dir).st_mtime_ns)]
+                with os.scandir(model_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            entries.append((entry.name, entry.stat().st_mtime_ns))
+            except OSError:
+                entries = [(model_dir, None)]
+            sig.append(tuple(sorted(entries, key=lambda e: e[0])))
+        return tuple(sig), self.config.get_custom_model_path()
+
+    def get_available_models(self, refresh: bool = False) -> list:
+        """Get list of available whisper models from all configured directories
 
+        Args:
+            refresh: Rescan even if the model directories look unchanged
+
+        Returns:
+            List of model display names
+        """
+        with self._scan_lock:
+            return self._scan_available_models(refresh)
+
+    def _scan_available_models(self, refresh: bool) -> list:
+        """Body of get_available_models(), run under the scan lock"""
         # Get all model directories from config
         model_dirs = self.config.get_model_directories()
 
-        # Standard model names to look for
-        supported_models = ['tiny', 'base', 'small', 'medium', 'large', 'large-v2', 'large-v3', 'large-v3-turbo']
+        sig = self._model_scan_signature(model_dirs)
+        if not refresh and self._scan_cache is not None and sig == self._scan_sig:
+            return list(self._scan_cache)
 
-        for model_dir_str in model_dirs:
-            model_dir = Path(model_dir_str).expanduser()
-            if not model_dir.exists():
+        # Every listed name also gets a model_paths entry, so membership checks
+        # go against the dict rather than scanning the list
+        available_models = []
+        model_paths = {}  # Track paths for display
+        internal_to_display = {}  # Map internal names to display names
+
+        # Directory walking is I/O bound, so directories (often on different
+        # disks or network mounts) are listed concurrently; results are then
+        # merged in configured order so the first directory still wins
+        if len(model_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(model_dirs))) as executor:
+                scans = list(executor.map(self._scan_model_dir, model_dirs))
+        else:
+            scans = [self._scan_model_dir(d) for d in model_dirs]
+
+        for scan in scans:
+            if scan is None:
                 continue
+            model_dir, names, finetunes = scan
 
             # Check for standard model files in this directory
-            for model in supported_models:
-                model_files = [
-                    model_dir / f"ggml-{model}.en.bin",  # English-only
-                    model_dir / f"ggml-{model}.bin"      # Multilingual
-                ]
-
-                for model_file in model_files:
-                    if model_file.exists():
-                        # Internal name for storage (e.g., "tiny" or "tiny.en")
-                        if model_file.name.endswith('.en.bin'):
-                            internal_name = f"{model}.en"
-                        else:
-                            internal_name = model
-
+            for model, candidates in _STOCK_MODEL_FILES:
+                for filename, internal_name in candidates:
+                    if filename in names:
                         # Display name for UI (e.g., "tiny stock")
                         display_name = f"{model} stock"
 
-                        if display_name not in available_models:
+                        if display_name not in model_paths:
                             available_models.append(display_name)
-                            model_paths[display_name] = str(model_file)
+                            model_paths[display_name] = str(model_dir / filename)
                             internal_to_display[internal_name] = display_name
                         break
 
             # Special handling for large-v3-turbo with alternate naming conventions
             turbo_display = 'large-v3-turbo stock'
-            if turbo_display not in available_models:
-                turbo_patterns = [
-                    # Standard naming
-                    model_dir / "ggml-large-v3-turbo.bin",
-                    model_dir / "ggml-large-v3-turbo.en.bin",
-                    # Alternate naming (used by dsnote, etc.)
-                    model_dir / "multilang_whisper_large3_turbo.ggml",
-                    model_dir / "whisper_large3_turbo.ggml",
-                    model_dir / "large-v3-turbo.ggml",
-                    model_dir / "ggml-large-v3-turbo.ggml",
-                ]
-                for turbo_file in turbo_patterns:
-                    if turbo_file.exists():
+            if turbo_display not in model_paths:
+                for filename in _TURBO_FILENAMES:
+                    if filename in names:
                         available_models.append(turbo_display)
-                        model_paths[turbo_display] = str(turbo_file)
+                        model_paths[turbo_display] = str(model_dir / filename)
                         internal_to_display['large-v3-turbo'] = turbo_display
                         break
 
-            # Scan for finetune models in this directory
-            self._scan_for_finetunes(model_dir, available_models, model_paths)
+            # Register finetune models found in this directory
+            for display_name, model_path in finetunes:
+                self._add_finetune(display_name, model_path, available_models, model_paths)
 
         # Add custom model path if set
         custom_path = self.config.get_custom_model_path()
         if custom_path and Path(custom_path).exists():
             custom_name = f"[Custom] {Path(custom_path).stem}"
-            if custom_name not in available_models:
+            if custom_name not in model_paths:
                 available_models.append(custom_name)
                 model_paths[custom_name] = custom_path
 
@@ -375,70 +1018,130 @@ class WhisperManager:
         self._model_paths = model_paths
         self._internal_to_display = internal_to_display
 
-        return available_models
+        self._scan_cache = available_models
+        self._scan_sig = sig
 
-    def _scan_for_finetunes(self, base_dir: Path, models_list: list, paths_dict: dict, max_depth: int = 3):
-        """Scan directory for finetune models (.bin files)"""
+        return list(available_models)
+
+    def _scan_model_dir(self, model_dir_str: str) -> Optional[Tuple[Path, set, list]]:
+        """
+        List one model directory without registering anything
+
+        Args:
+            model_dir_str: Configured model directory
+
+        Returns:
+            (model_dir, top-level entry names, finetune candidates) or None
+            if the directory cannot be read
+        """
+        model_dir = Path(model_dir_str).expanduser()
+
+        # List the directory once; stock file names are matched against it
+        # rather than probing every candidate name with its own stat
+        try:
+            with os.scandir(model_dir) as it:
+                entries = list(it)
+        except OSError:
+            return None
+
+        finetunes = []
+        self._scan_for_finetunes(model_dir, finetunes, entries=entries)
+        return model_dir, {entry.name for entry in entries}, finetunes
+
+    def _scan_for_finetunes(self, base_dir, found: list, max_depth: int = 3, entries: Optional[list] = None):
+        """Scan directory for finetune models (.bin files)
+
+        Uses os.scandir so entry types come from the directory listing itself
+        rather than a separate stat per entry.
+
+        Args:
+            base_dir: Directory to scan
+            found: Receives (display name, model path) tuples in scan order
+            max_depth: Directory levels left to descend
+            entries: Already-listed contents of base_dir, if available
+        """
         if max_depth <= 0:
             return
 
-        try:
-            for item in base_dir.iterdir():
-                if item.is_dir():
-                    # Check for ggml-model.bin in this directory (common finetune convention)
-                    ggml_model = item / "ggml-model.bin"
-                    if ggml_model.exists():
-                        # Use directory name as finetune name with "- fine tune" suffix
-                        display_name = f"{item.name} - fine tune"
-
-                        # Avoid duplicates
-                        base_display_name = display_name
-                        counter = 1
-                        while display_name in paths_dict and paths_dict[display_name] != str(ggml_model):
-                            display_name = f"{base_display_name} ({counter})"
-                            counter += 1
-
-                        if display_name not in models_list:
-                            models_list.append(display_name)
-                            paths_dict[display_name] = str(ggml_model)
-
-                    # Recurse into subdirectories
-                    self._scan_for_finetunes(item, models_list, paths_dict, max_depth - 1)
-
-                elif item.is_file() and item.suffix == '.bin':
-                    # Check for standalone .bin files that look like finetunes
-                    # Skip standard model files (they're already handled above)
-                    stem_lower = item.stem.lower()
-                    standard_patterns = ['ggml-tiny', 'ggml-base', 'ggml-small', 'ggml-medium', 'ggml-large']
-                    is_standard = any(stem_lower.startswith(p) for p in standard_patterns)
-
-                    # Check if it looks like a finetune (contains "ggml" or "fine-tune" or "finetune")
-                    is_finetune = ('ggml' in stem_lower or 'fine-tune' in stem_lower or
-                                   'finetune' in stem_lower or 'fine_tune' in stem_lower)
-
-                    if not is_standard and is_finetune:
-                        # This looks like a custom/finetune model - use "- fine tune" suffix
-                        display_name = f"{item.stem} - fine tune"
-
-                        # Avoid duplicates
-                        base_display_name = display_name
-                        counter = 1
-                        while display_name in paths_dict and paths_dict[display_name] != str(item):
-                            display_name = f"{base_display_name} ({counter})"
-                            counter += 1
-
-                        if display_name not in models_list:
-                            models_list.append(display_name)
-                            paths_dict[display_name] = str(item)
-
-        except PermissionError:
-            pass  # Skip directories we can't read
+        if entries is None:
+            try:
+                with os.scandir(base_dir) as it:
+                    entries = list(it)
+            except (PermissionError, FileNotFoundError, NotADirectoryError):
+                return  # Skip directories we can't read
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if is_dir:
+                # Check for ggml-model.bin in this directory (common finetune convention)
+                ggml_model = os.path.join(entry.path, "ggml-model.bin")
+                if os.path.exists(ggml_model):
+                    # Use directory name as finetune name with "- fine tune" suffix
+                    found.append((f"{entry.name} - fine tune", ggml_model))
+
+                # Recurse into subdirectories
+                self._scan_for_finetunes(entry.path, found, max_depth - 1)
+
+            else:
+                stem, suffix = os.path.splitext(entry.name)
+                if suffix != '.bin' or not entry.is_file():
+                    continue
+
+                # Check for standalone .bin files that look like finetunes
+                # Skip standard model files (they're already handled above)
+                stem_lower = stem.lower()
+                is_standard = stem_lower.startswith(_STANDARD_MODEL_PREFIXES)
+
+                # Check if it looks like a finetune (contains "ggml" or "fine-tune" or "finetune")
+                is_finetune = _FINETUNE_STEM.search(stem_lower) is not None
+
+                if not is_standard and is_finetune:
+                    # This looks like a custom/finetune model - use "- fine tune" suffix
+                    found.append((f"{stem} - fine tune", entry.path))
+
+    def _add_finetune(self, display_name: str, model_path: str, models_list: list, paths_dict: dict):
+        """Register a finetune under a display name, suffixing a counter on name clashes"""
+        # Avoid duplicates
+        base_display_name = display_name
+        counter = 1
+        while display_name in paths_dict and paths_dict[display_name] != model_path:
+            display_name = f"{base_display_name} ({counter})"
+            counter += 1
+
+        if display_name not in paths_dict:
+            models_list.append(display_name)
+            paths_dict[display_name] = model_path
+
+    def _find_model_file(self, model_name: str) -> Tuple[Optional[Path], bool]:
+        """
+        Locate a model file by display name, checking each candidate once
+
+        Args:
+            model_name: Display name of the model
+
+        Returns:
+            (path, exists) - the best candidate path and whether it exists
+        """
+        # Check cached paths first
+        candidate = self.get_model_path(model_name)
+        if candidate is not None and candidate.exists():
+            return candidate, True
+
+        # Try config manager as fallback with internal name conversion
+        internal_name = self._get_internal_name(model_name)
+        candidate = self.config.get_whisper_model_path(internal_name)
+        return candidate, candidate is not None and candidate.exists()
 
     def get_model_path(self, model_name: str) -> Optional[Path]:
         """Get the full path for a model by name"""
         # Check cached paths first
-        if hasattr(self, '_model_paths') and model_name in self._model_paths:
-            return Path(self._model_paths[model_name])
+        path = self._model_paths.get(model_name)
+        if path:
+            return Path(path)
 
         # Fall back to config manager
         return self.config.get_whisper_model_path(model_name)